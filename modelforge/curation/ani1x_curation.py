@@ -1,4 +1,7 @@
-from modelforge.curation.curation_baseclass import DatasetCuration
+from modelforge.curation.curation_baseclass import (
+    DatasetCuration,
+    HDF5_READ_CHUNK_CACHE,
+)
 from typing import Optional
 from loguru import logger
 from openff.units import unit
@@ -276,6 +279,8 @@ class ANI1xCuration(DatasetCuration):
         --------
         """
         import h5py
+        from itertools import islice
+        import numpy as np
         from tqdm import tqdm
         from numpy import newaxis
 
@@ -302,16 +307,17 @@ class ANI1xCuration(DatasetCuration):
             "wb97x_tz.mbis_octupoles": True,
             "wb97x_tz.mbis_volumes": True,
         }
-        with h5py.File(input_file_name, "r") as hf:
-            names = list(hf.keys())
+        with h5py.File(input_file_name, "r", **HDF5_READ_CHUNK_CACHE) as hf:
+            # iterate the file's groups directly rather than building a
+            # list of all record names first
             if max_records is None:
-                n_max = len(names)
+                n_max = len(hf)
             elif max_records is not None:
                 n_max = max_records
 
             conformers_counter = 0
 
-            for i, name in tqdm(enumerate(names[0:n_max]), total=n_max):
+            for i, name in tqdm(enumerate(islice(hf, n_max)), total=n_max):
                 if total_conformers is not None:
                     if conformers_counter >= total_conformers:
                         break
@@ -331,8 +337,6 @@ class ANI1xCuration(DatasetCuration):
 
                 n_configs = conformers_per_molecule
 
-                keys_list = list(hf[name].keys())
-
                 # temp dictionary for ANI-1x and ANI-1ccx data
                 ani1x_temp = {}
 
@@ -349,12 +353,19 @@ class ANI1xCuration(DatasetCuration):
                     if param_out == "geometry":
                         param_in = "coordinates"
 
-                    temp = hf[name][param_in][()]
+                    # only read the conformers we keep, directly into a
+                    # preallocated buffer
+                    dataset = hf[name][param_in]
+                    temp = np.empty(
+                        (n_configs,) + dataset.shape[1:], dtype=dataset.dtype
+                    )
+                    # an empty selection is rejected by h5py; records without
+                    # conformers keep the empty buffer
+                    if n_configs > 0:
+                        dataset.read_direct(temp, source_sel=np.s_[0:n_configs])
                     if param_in in add_new_axis:
                         temp = temp[..., newaxis]
 
-                    temp = temp[0:conformers_per_molecule]
-
                     param_unit = param_data["u_in"]
                     if param_unit is not None:
                         ani1x_temp[param_out] = temp * param_unit
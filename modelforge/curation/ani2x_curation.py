@@ -1,4 +1,7 @@
-from modelforge.curation.curation_baseclass import DatasetCuration
+from modelforge.curation.curation_baseclass import (
+    DatasetCuration,
+    HDF5_READ_CHUNK_CACHE,
+)
 from typing import Optional
 from loguru import logger
 from openff.units import unit
@@ -161,7 +164,7 @@ class ANI2xCuration(DatasetCuration):
 
         conformers_counter = 0
 
-        with h5py.File(input_file_name, "r") as hf:
+        with h5py.File(input_file_name, "r", **HDF5_READ_CHUNK_CACHE) as hf:
             #  The ani2x hdf5 file groups molecules by number of atoms
             # we need to break up each of these groups into individual molecules
             mol_counter = 0
@@ -1,12 +1,35 @@
 from abc import ABC, abstractmethod
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from loguru import logger
 from openff.units import unit
 
+# chunk cache settings used when reading the raw hdf5 files of the datasets; the
+# default 1 MiB cache is too small for the compressed chunks of these files and
+# leads to chunks being evicted and decompressed repeatedly. The cache is kept
+# per dataset, so it only needs to hold the largest property of a single record
+# (e.g., the octupoles of all conformers of a SPICE record)
+HDF5_READ_CHUNK_CACHE = {
+    "rdcc_nbytes": 8 * 1024 * 1024,
+    "rdcc_nslots": 100003,
+    "rdcc_w0": 0.75,
+}
+
+
+# largest series dataset (in bytes) written to hdf5 as a single chunk; this stays
+# below the size of the read chunk cache so a record is decompressed exactly once
+HDF5_MAX_SINGLE_CHUNK_NBYTES = 4 * 1024 * 1024
+
 
 def dict_to_hdf5(
-    file_name: str, data: List[dict], series_info: Dict[str, str], id_key: str
+    file_name: str,
+    data: List[dict],
+    series_info: Dict[str, str],
+    id_key: str,
+    compression: Optional[str] = None,
+    compression_opts: Optional[int] = 1,
+    storage_dtype: Optional[str] = None,
+    libver: Union[str, Tuple[str, str]] = ("earliest", "v110"),
 ) -> None:
     """
     Writes an hdf5 file from a list of dicts.
@@ -27,6 +50,24 @@ def dict_to_hdf5(
         Options in dictionary include 'single_rec', 'single_atom', 'single_mol', 'series_atom', 'series_mol'.
     id_key: str, required
         Name of the key in the dicts that uniquely describes each record.
+    compression: str, optional, default=None
+        Compression filter applied to series datasets (e.g., "gzip", "lzf"); series datasets are stored as a
+        single chunk (up to HDF5_MAX_SINGLE_CHUNK_NBYTES, chunked automatically by h5py above that), matching
+        how records are read. If None, all datasets are written contiguous and uncompressed.
+        gzip is built into every HDF5 library; "lzf" is only available through h5py, so files written with it
+        cannot be read by other HDF5 readers.
+    compression_opts: int, optional, default=1
+        Options passed to the compression filter, e.g., the gzip level. Ignored for filters without options.
+    storage_dtype: str, optional, default=None
+        If set (e.g., "float16"), floating point per-atom series datasets (e.g., geometry, forces) are cast to
+        this dtype before writing, trading precision for file size; per-molecule series such as energies keep
+        their dtype. A ValueError is raised if a finite value lies outside the range of storage_dtype.
+        HDF5Dataset upcasts these datasets to float32 on read. If None, arrays are written as is.
+    libver: str or tuple of str, optional, default=("earliest", "v110")
+        Bounds on the HDF5 file format versions, passed to h5py.File. The default writes the earliest format
+        that can hold the data, which HDF5 1.8 readers can open. "latest" uses the newest format, with cheaper
+        metadata updates for files with many groups and support for single-writer/multiple-reader (SWMR)
+        access, but the files can then only be read with HDF5 1.10 or newer.
 
     Examples
     --------
@@ -44,7 +85,14 @@ def dict_to_hdf5(
 
     dt = h5py.special_dtype(vlen=str)
 
-    with h5py.File(file_name, "w") as f:
+    if storage_dtype is not None:
+        if not np.issubdtype(np.dtype(storage_dtype), np.floating):
+            raise ValueError(
+                f"storage_dtype must be a floating point type, got {storage_dtype}."
+            )
+        storage_max = np.finfo(storage_dtype).max
+
+    with h5py.File(file_name, "w", libver=libver) as f:
         for datapoint in tqdm(data):
             try:
                 record_name = datapoint[id_key]
@@ -61,17 +109,58 @@ def dict_to_hdf5(
                         val_u = None
 
                     if isinstance(val_m, str):
-                        group.create_dataset(name=key, data=val_m, dtype=dt)
+                        dataset = group.create_dataset(name=key, data=val_m, dtype=dt)
                     elif isinstance(val_m, (float, int)):
-                        group.create_dataset(name=key, data=val_m)
+                        dataset = group.create_dataset(name=key, data=val_m)
                     elif isinstance(val_m, np.ndarray):
-                        group.create_dataset(name=key, data=val_m, shape=val_m.shape)
+                        if (
+                            storage_dtype is not None
+                            and series_info[key] == "series_atom"
+                            and np.issubdtype(val_m.dtype, np.floating)
+                        ):
+                            # astype silently turns out-of-range values into inf
+                            if np.any(
+                                np.isfinite(val_m) & (np.abs(val_m) > storage_max)
+                            ):
+                                raise ValueError(
+                                    f"{key} of record {record_name} has values outside the range of storage_dtype {storage_dtype}."
+                                )
+                            val_m = val_m.astype(storage_dtype)
+                        if (
+                            compression is not None
+                            and series_info[key].startswith("series")
+                            and val_m.ndim > 0
+                            and val_m.size > 0
+                        ):
+                            # records are always read in full (all conformers),
+                            # so store each series as a single chunk unless it
+                            # is large, in which case let h5py pick the shape
+                            dataset = group.create_dataset(
+                                name=key,
+                                data=val_m,
+                                shape=val_m.shape,
+                                chunks=(
+                                    val_m.shape
+                                    if val_m.nbytes <= HDF5_MAX_SINGLE_CHUNK_NBYTES
+                                    else True
+                                ),
+                                compression=compression,
+                                compression_opts=(
+                                    None if compression == "lzf" else compression_opts
+                                ),
+                            )
+                        else:
+                            dataset = group.create_dataset(
+                                name=key, data=val_m, shape=val_m.shape
+                            )
                     else:
                         raise ValueError(f"Type {type(val_m)} not recognized.")
+                    # set the attributes on the handle returned by create_dataset
+                    # rather than looking the dataset up by name again
                     if not val_u is None:
-                        group[key].attrs["u"] = val_u
+                        dataset.attrs["u"] = val_u
 
-                    group[key].attrs["format"] = series_info[key]
+                    dataset.attrs["format"] = series_info[key]
 
 
 class DatasetCuration(ABC):
@@ -86,6 +175,7 @@ class DatasetCuration(ABC):
         local_cache_dir: Optional[str] = "./datasets",
         version_select: str = "latest",
         convert_units: Optional[bool] = True,
+        storage_dtype: Optional[str] = None,
     ):
         """
         Sets input and output parameters.
@@ -103,6 +193,9 @@ class DatasetCuration(ABC):
         convert_units: bool, optional, default=True
             Convert from [e.g., angstrom, bohr, hartree] (i.e., source units)
             to [nanometer, kJ/mol] (i.e., target units)
+        storage_dtype: str, optional, default=None
+            Floating point dtype (e.g., "float16") used to store per-atom series (e.g., geometry, forces)
+            in the hdf5 file; see dict_to_hdf5. If None, arrays are written with their own dtype.
         """
         import os
 
@@ -111,6 +204,7 @@ class DatasetCuration(ABC):
         # make sure we can handle a path with a ~ in it
         self.local_cache_dir = os.path.expanduser(local_cache_dir)
         self.convert_units = convert_units
+        self.storage_dtype = storage_dtype
         self.version_select = version_select
         os.makedirs(self.local_cache_dir, exist_ok=True)
 
@@ -146,6 +240,7 @@ class DatasetCuration(ABC):
             self.data,
             series_info=self._record_entries_series,
             id_key="name",
+            storage_dtype=self.storage_dtype,
         )
 
     def _convert_units(self):
@@ -158,13 +253,29 @@ class DatasetCuration(ABC):
         # this is needed for the "chem" context to convert hartrees to kj/mol
         from modelforge.utils.units import chem_context
 
+        # multiplicative conversions reduce to a single scale factor per
+        # (input, output) unit pair; compute each factor once and apply it to
+        # the magnitude directly rather than going through pint for every array
+        conversion_factors = {}
+
         for datapoint in self.data:
             for key, val in datapoint.items():
                 if isinstance(val, pint.Quantity):
+                    u_out = self.qm_parameters[key]["u_out"]
                     try:
-                        datapoint[key] = val.to(
-                            self.qm_parameters[key]["u_out"], "chem"
-                        )
+                        pair = (val.u, u_out)
+                        if pair not in conversion_factors:
+                            factor = unit.Quantity(1.0, val.u).to(u_out, "chem").m
+                            # units with an offset (e.g., degC) are not a pure scaling
+                            if unit.Quantity(0.0, val.u).to(u_out, "chem").m != 0.0:
+                                factor = None
+                            conversion_factors[pair] = factor
+
+                        factor = conversion_factors[pair]
+                        if factor is None:
+                            datapoint[key] = val.to(u_out, "chem")
+                        else:
+                            datapoint[key] = (val.m * factor) * u_out
                     except:
                         # if the unit conversion can't be done
                         raise Exception(
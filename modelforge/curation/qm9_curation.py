@@ -2,11 +2,283 @@ from modelforge.curation.curation_baseclass import DatasetCuration
 from modelforge.utils.units import chem_context
 import numpy as np
 
-from typing import Optional, List
+from typing import Dict, Optional, List, TextIO, Tuple
 from loguru import logger
 from openff.units import unit
 
 
+def _qm9_reference_thermochemistry(
+    thermochemical_references: Dict[str, dict], molecule: List[str], thermo_key: str
+):
+    # for a given key all references share the same unit; accumulate the
+    # magnitudes and attach the unit once rather than adding quantities
+    reference_unit = thermochemical_references[molecule[0]][thermo_key].u
+    sum_of_energy = 0
+    for atom in molecule:
+        sum_of_energy += thermochemical_references[atom][thermo_key].m
+
+    return sum_of_energy * reference_unit
+
+
+def _parse_qm9_properties(line: str) -> dict:
+    """
+    Parses the line in the xyz file that contains property information.
+
+    Properties
+    ----------
+    line: str, required
+        String to parse that contains property information. The structure of this line
+        following the description in the original manuscript (See tables 2 and 3).
+
+    Returns
+    -------
+    dict
+        Dictionary of properties, with units added when appropriate.
+    """
+
+    from modelforge.utils.misc import str_to_float
+
+    temp_prop = line.split()
+
+    # List of properties in the order they appear in the file and if they have units
+    # This is used in parsing the properties line in the .xyz file
+    labels = [
+        "tag",
+        "idx",
+        "rotational_constant_A",
+        "rotational_constant_B",
+        "rotational_constant_C",
+        "dipole_moment",
+        "isotropic_polarizability",
+        "energy_of_homo",
+        "energy_of_lumo",
+        "lumo-homo_gap",
+        "electronic_spatial_extent",
+        "zero_point_vibrational_energy",
+        "internal_energy_at_0K",
+        "internal_energy_at_298.15K",
+        "enthalpy_at_298.15K",
+        "free_energy_at_298.15K",
+        "heat_capacity_at_298.15K",
+    ]
+
+    assert len(labels) == len(temp_prop)
+
+    data_temp = {}
+    for prop, label in zip(temp_prop, labels):
+        if label == "tag" or label == "idx":
+            data_temp[label] = prop
+        else:
+            data_temp[label] = str_to_float(prop)
+
+    return data_temp
+
+
+def _parse_qm9_xyz(
+    file: TextIO,
+    name: str,
+    qm_parameters: Dict[str, dict],
+    thermochemical_references: Dict[str, dict],
+) -> dict:
+    """
+    Parses the content of a single QM9 xyz file.
+
+    See QM9Curation._parse_xyzfile for the structure of the file. This is a module-level function,
+    rather than a method, so that it can be sent to worker processes without the curation object.
+
+    Parameters
+    ----------
+    file: TextIO, required
+        Open text stream positioned at the start of the xyz content, e.g., a file or io.StringIO.
+    name: str, required
+        Name of the record, i.e., the file name without extension.
+    qm_parameters: dict, required
+        Input and output units of each property, i.e., QM9Curation.qm_parameters.
+    thermochemical_references: dict, required
+        Reference thermochemistry of each element, i.e., QM9Curation.thermochemical_references.
+
+    Returns
+    -------
+        dict:
+            Dict of parsed properties.
+    """
+    from modelforge.utils.io import import_
+
+    qcel = import_("qcelemental")
+    from modelforge.utils.misc import str_to_float_array
+
+    # temporary dictionary to store data for each file
+    data_temp = {}
+
+    # line 1: provides the number of atoms
+    n_atoms = int(file.readline())
+
+    # line 2: provides properties that we will parse into a dict
+    properties_temp = file.readline()
+    properties = _parse_qm9_properties(properties_temp)
+
+    # Lines 3 to 3+n: element, coordinates and charge of each atom.
+    # The block is split into an [n,5] string array and the numeric
+    # columns are converted in one call, rather than value by value.
+    atom_block = np.array([file.readline().split() for _ in range(n_atoms)]).reshape(
+        n_atoms, 5
+    )
+    elements = atom_block[:, 0].tolist()
+    atomic_numbers = [
+        qcel.periodictable.to_atomic_number(element) for element in elements
+    ]
+    coordinates_and_charges = str_to_float_array(atom_block[:, 1:])
+    geometry = coordinates_and_charges[:, 0:3]
+    charges = coordinates_and_charges[:, 3]
+
+    # line 3+n+1: read harmonic_vibrational_frequencies
+    hvf_temp = file.readline().split()
+
+    # line 3+n+2: SMILES string
+    smiles = file.readline().split()
+
+    # line 3+n+3: inchi string
+    InChI = file.readline()
+
+    # end of file, now parse the inputs
+
+    data_temp["name"] = name
+    data_temp["n_configs"] = 1
+    data_temp["smiles_gdb-17"] = smiles[0]
+    data_temp["smiles_b3lyp"] = smiles[1]
+    data_temp["inchi_corina"] = InChI.split("\n")[0].split()[0].replace("InChI=", "")
+    data_temp["inchi_b3lyp"] = InChI.split("\n")[0].split()[1].replace("InChI=", "")
+    data_temp["idx"] = properties["idx"]
+    # even though we do not have multiple conformers, let us still define
+    # geometry as [m,n,3], where number of conformers, m=1
+    data_temp["geometry"] = (
+        np.array(geometry).reshape(1, -1, 3) * qm_parameters["geometry"]["u_in"]
+    )
+    # atomic_numbers are written as an [n,1] array
+    data_temp["atomic_numbers"] = np.array(atomic_numbers).reshape(-1, 1)
+    # charges are written as an [m,n,1] array; note m =1 in this case
+    data_temp["charges"] = (
+        np.array(charges).reshape(1, -1, 1) * qm_parameters["charges"]["u_in"]
+    )
+
+    # remove the tag because it does not provide any useful information
+    # also remove idx as we've already added it
+    properties.pop("tag")
+    properties.pop("idx")
+
+    # merge rotational constants into a single energy
+    data_temp["rotational_constants"] = qm_parameters["rotational_constants"][
+        "u_in"
+    ] * np.array(
+        [
+            properties["rotational_constant_A"],
+            properties["rotational_constant_B"],
+            properties["rotational_constant_C"],
+        ]
+    ).reshape(
+        1, 3
+    )
+
+    properties.pop("rotational_constant_A")
+    properties.pop("rotational_constant_B")
+    properties.pop("rotational_constant_C")
+
+    # loop over remaining properties and add to the dict
+    # all properties are per-molecule, so array size will be [m,1], with m=1
+    for property, val in properties.items():
+        data_temp[property] = qm_parameters[property]["u_in"] * np.array(val).reshape(
+            1, 1
+        )
+
+    # calculate the reference energy at 0K and 298.15K
+    # this is done by summing the reference energies of the atoms
+    # note this has units already attached
+    U_ref_0K = _qm9_reference_thermochemistry(
+        thermochemical_references, elements, "U_0K"
+    )
+    U_ref_298K = _qm9_reference_thermochemistry(
+        thermochemical_references, elements, "U_298.15K"
+    )
+    H_ref_298K = _qm9_reference_thermochemistry(
+        thermochemical_references, elements, "H_298.15K"
+    )
+    G_ref_298K = _qm9_reference_thermochemistry(
+        thermochemical_references, elements, "G_298.15K"
+    )
+
+    data_temp["reference_energy_at_0K"] = (
+        np.array(U_ref_0K.m).reshape(1, 1) * U_ref_0K.u
+    )
+    data_temp["reference_energy_at_298.15K"] = (
+        np.array(U_ref_298K.m).reshape(1, 1) * U_ref_298K.u
+    )
+    data_temp["reference_enthalpy_at_298.15K"] = (
+        np.array(H_ref_298K.m).reshape(1, 1) * H_ref_298K.u
+    )
+
+    data_temp["reference_free_energy_at_298.15K"] = (
+        np.array(G_ref_298K.m).reshape(1, 1) * G_ref_298K.u
+    )
+
+    data_temp["formation_energy_at_0K"] = (
+        data_temp["internal_energy_at_0K"] - data_temp["reference_energy_at_0K"]
+    )
+
+    data_temp["harmonic_vibrational_frequencies"] = (
+        str_to_float_array(hvf_temp).reshape(1, -1)
+        * qm_parameters["harmonic_vibrational_frequencies"]["u_in"]
+    )
+
+    return data_temp
+
+
+def _parse_qm9_xyz_text(
+    text: str,
+    name: str,
+    qm_parameters: Dict[str, dict],
+    thermochemical_references: Dict[str, dict],
+) -> dict:
+    """
+    Parses the content of a single QM9 xyz file given as a string; see _parse_qm9_xyz.
+    """
+    import io
+
+    return _parse_qm9_xyz(
+        io.StringIO(text), name, qm_parameters, thermochemical_references
+    )
+
+
+def _parse_qm9_xyz_texts(
+    members: List[Tuple[str, str]],
+    qm_parameters: Dict[str, dict],
+    thermochemical_references: Dict[str, dict],
+) -> List[dict]:
+    """
+    Parses a batch of (text, name) pairs of QM9 xyz files; see _parse_qm9_xyz.
+    """
+    return [
+        _parse_qm9_xyz_text(text, name, qm_parameters, thermochemical_references)
+        for text, name in members
+    ]
+
+
+def _parse_qm9_xyzfile(
+    file_name: str,
+    qm_parameters: Dict[str, dict],
+    thermochemical_references: Dict[str, dict],
+) -> dict:
+    """
+    Parses a single QM9 xyz file; see _parse_qm9_xyz.
+    """
+    with open(file_name, "r") as file:
+        return _parse_qm9_xyz(
+            file,
+            file_name.split("/")[-1].split(".")[0],
+            qm_parameters,
+            thermochemical_references,
+        )
+
+
 class QM9Curation(DatasetCuration):
     """
         Routines to fetch and process the QM9 dataset into a curated hdf5 file.
@@ -274,11 +546,9 @@ class QM9Curation(DatasetCuration):
     def _calculate_reference_thermochemistry(
         self, molecule: List[str], thermo_key: str
     ):
-        sum_of_energy = 0
-        for atom in molecule:
-            sum_of_energy += self.thermochemical_references[atom][thermo_key]
-
-        return sum_of_energy
+        return _qm9_reference_thermochemistry(
+            self.thermochemical_references, molecule, thermo_key
+        )
 
     def _parse_properties(self, line: str) -> dict:
         """
@@ -295,43 +565,7 @@ class QM9Curation(DatasetCuration):
         dict
             Dictionary of properties, with units added when appropriate.
         """
-
-        from modelforge.utils.misc import str_to_float
-
-        temp_prop = line.split()
-
-        # List of properties in the order they appear in the file and if they have units
-        # This is used in parsing the properties line in the .xyz file
-        labels = [
-            "tag",
-            "idx",
-            "rotational_constant_A",
-            "rotational_constant_B",
-            "rotational_constant_C",
-            "dipole_moment",
-            "isotropic_polarizability",
-            "energy_of_homo",
-            "energy_of_lumo",
-            "lumo-homo_gap",
-            "electronic_spatial_extent",
-            "zero_point_vibrational_energy",
-            "internal_energy_at_0K",
-            "internal_energy_at_298.15K",
-            "enthalpy_at_298.15K",
-            "free_energy_at_298.15K",
-            "heat_capacity_at_298.15K",
-        ]
-
-        assert len(labels) == len(temp_prop)
-
-        data_temp = {}
-        for prop, label in zip(temp_prop, labels):
-            if label == "tag" or label == "idx":
-                data_temp[label] = prop
-            else:
-                data_temp[label] = str_to_float(prop)
-
-        return data_temp
+        return _parse_qm9_properties(line)
 
     def _parse_xyzfile(self, file_name: str) -> dict:
         """
@@ -383,149 +617,126 @@ class QM9Curation(DatasetCuration):
         17  cal/mol/K   Heat capacity at 298.15K
 
         """
-        from modelforge.utils.io import import_
-
-        qcel = import_("qcelemental")
-        from modelforge.utils.misc import str_to_float
-
-        with open(file_name, "r") as file:
-            # temporary dictionary to store data for each file
-            data_temp = {}
-
-            # line 1: provides the number of atoms
-            n_atoms = int(file.readline())
-
-            # line 2: provides properties that we will parse into a dict
-            properties_temp = file.readline()
-            properties = self._parse_properties(properties_temp)
-
-            # temporary lists
-            elements = []
-            atomic_numbers = []
-            geometry = []
-            charges = []
-            hvf = []
-
-            # Lines 3 to 3+n: loop over the atoms to get coordinates and charges
-            for i in range(n_atoms):
-                line = file.readline()
-                element, x, y, z, q = line.split()
-                elements.append(element)
-                atomic_numbers.append(qcel.periodictable.to_atomic_number(element))
-                temp = [
-                    str_to_float(x),
-                    str_to_float(y),
-                    str_to_float(z),
-                ]
-                geometry.append(temp)
-                charges.append([str_to_float(q)])
-
-            # line 3+n+1: read harmonic_vibrational_frequencies
-            hvf_temp = file.readline().split()
-
-            # line 3+n+2: SMILES string
-            smiles = file.readline().split()
-
-            # line 3+n+3: inchi string
-            InChI = file.readline()
-
-            # end of file, now parse the inputs
-
-            data_temp["name"] = file_name.split("/")[-1].split(".")[0]
-            data_temp["n_configs"] = 1
-            data_temp["smiles_gdb-17"] = smiles[0]
-            data_temp["smiles_b3lyp"] = smiles[1]
-            data_temp["inchi_corina"] = (
-                InChI.split("\n")[0].split()[0].replace("InChI=", "")
-            )
-            data_temp["inchi_b3lyp"] = (
-                InChI.split("\n")[0].split()[1].replace("InChI=", "")
-            )
-            data_temp["idx"] = properties["idx"]
-            # even though we do not have multiple conformers, let us still define
-            # geometry as [m,n,3], where number of conformers, m=1
-            data_temp["geometry"] = (
-                np.array(geometry).reshape(1, -1, 3)
-                * self.qm_parameters["geometry"]["u_in"]
-            )
-            # atomic_numbers are written as an [n,1] array
-            data_temp["atomic_numbers"] = np.array(atomic_numbers).reshape(-1, 1)
-            # charges are written as an [m,n,1] array; note m =1 in this case
-            data_temp["charges"] = (
-                np.array(charges).reshape(1, -1, 1)
-                * self.qm_parameters["charges"]["u_in"]
-            )
-
-            # remove the tag because it does not provide any useful information
-            # also remove idx as we've already added it
-            properties.pop("tag")
-            properties.pop("idx")
-
-            # merge rotational constants into a single energy
-            data_temp["rotational_constants"] = self.qm_parameters[
-                "rotational_constants"
-            ]["u_in"] * np.array(
-                [
-                    properties["rotational_constant_A"],
-                    properties["rotational_constant_B"],
-                    properties["rotational_constant_C"],
-                ]
-            ).reshape(
-                1, 3
-            )
+        return _parse_qm9_xyzfile(
+            file_name, self.qm_parameters, self.thermochemical_references
+        )
 
-            properties.pop("rotational_constant_A")
-            properties.pop("rotational_constant_B")
-            properties.pop("rotational_constant_C")
-
-            # loop over remaining properties and add to the dict
-            # all properties are per-molecule, so array size will be [m,1], with m=1
-            for property, val in properties.items():
-                data_temp[property] = self.qm_parameters[property]["u_in"] * np.array(
-                    val
-                ).reshape(1, 1)
-
-            # calculate the reference energy at 0K and 298.15K
-            # this is done by summing the reference energies of the atoms
-            # note this has units already attached
-            U_ref_0K = self._calculate_reference_thermochemistry(elements, "U_0K")
-            U_ref_298K = self._calculate_reference_thermochemistry(
-                elements, "U_298.15K"
-            )
-            H_ref_298K = self._calculate_reference_thermochemistry(
-                elements, "H_298.15K"
-            )
-            G_ref_298K = self._calculate_reference_thermochemistry(
-                elements, "G_298.15K"
-            )
+    def _process_downloaded_archive(
+        self,
+        archive_path: str,
+        max_records: Optional[int] = None,
+        max_conformers_per_record: Optional[int] = None,
+        total_conformers: Optional[int] = None,
+        n_workers: int = 1,
+    ):
+        """
+        Processes the downloaded tar.bz2 archive without extracting it to disk.
 
-            data_temp["reference_energy_at_0K"] = (
-                np.array(U_ref_0K.m).reshape(1, 1) * U_ref_0K.u
-            )
-            data_temp["reference_energy_at_298.15K"] = (
-                np.array(U_ref_298K.m).reshape(1, 1) * U_ref_298K.u
-            )
-            data_temp["reference_enthalpy_at_298.15K"] = (
-                np.array(H_ref_298K.m).reshape(1, 1) * H_ref_298K.u
-            )
+        The xyz files are read from the archive in memory, in the order they are stored. Records are sorted
+        by name afterwards, and subsets selected with max_records/total_conformers hold the first files sorted
+        by name, as when processing an extracted directory with _process_downloaded.
 
-            data_temp["reference_free_energy_at_298.15K"] = (
-                np.array(G_ref_298K.m).reshape(1, 1) * G_ref_298K.u
-            )
+        Parameters
+        ----------
+        archive_path: str, required
+            Path to the tar.bz2 file.
+        max_records: int, optional, default=None
+            If set to an integer, 'n_r', the routine will only process the first 'n_r' records sorted by file name, useful for unit tests.
+        max_conformers_per_record: int, optional, default=None
+            Not used for QM9, as there is only one conformer per record.
+        total_conformers: int, optional, default=None
+            If set to an integer, 'n_t', the routine will only process the first 'n_t' conformers sorted by file name, useful for unit tests.
+        n_workers: int, optional, default=1
+            Number of processes used to parse the xyz files.
 
-            data_temp["formation_energy_at_0K"] = (
-                data_temp["internal_energy_at_0K"] - data_temp["reference_energy_at_0K"]
-            )
+        """
+        import bisect
+        import os
+        import tarfile
+        from tqdm import tqdm
 
-            for h in hvf_temp:
-                hvf.append(str_to_float(h))
+        # qm9 only has a single conformer per record, max_records and total_conformers behave the same way
+        n_max = max_records if max_records is not None else total_conformers
 
-            data_temp["harmonic_vibrational_frequencies"] = (
-                np.array(hvf).reshape(1, -1)
-                * self.qm_parameters["harmonic_vibrational_frequencies"]["u_in"]
+        if max_conformers_per_record is not None:
+            logger.warning(
+                "max_conformers_per_record is not used for QM9 dataset as there is only one conformer per record. Using a value of 1"
             )
 
-        return data_temp
+        def _xyz_members(tar: tarfile.TarFile):
+            # members have to be read sequentially, seeking backwards in a bz2 stream is expensive
+            if n_max is None:
+                for member in tar:
+                    if member.isfile() and member.name.endswith(".xyz"):
+                        yield (
+                            tar.extractfile(member).read().decode("utf-8"),
+                            os.path.basename(member.name).split(".")[0],
+                        )
+                return
+
+            # a subset has to hold the first n_max files sorted by name, as when
+            # listing an extracted directory, which need not be the first n_max
+            # members of the archive; keep the n_max smallest names seen so far
+            selected = []  # (file name, text), sorted by file name
+            for member in tar:
+                if n_max <= 0:
+                    break
+                if not (member.isfile() and member.name.endswith(".xyz")):
+                    continue
+                file_name = os.path.basename(member.name)
+                if len(selected) == n_max and file_name >= selected[-1][0]:
+                    continue
+                bisect.insort(
+                    selected,
+                    (file_name, tar.extractfile(member).read().decode("utf-8")),
+                )
+                if len(selected) > n_max:
+                    selected.pop()
+            for file_name, text in selected:
+                yield text, file_name.split(".")[0]
+
+        logger.debug(f"Reading xyz files from {archive_path}")
+        with tarfile.open(archive_path, "r:bz2") as tar:
+            members = tqdm(_xyz_members(tar), desc="processing")
+            if n_workers > 1:
+                from collections import deque
+                from concurrent.futures import ProcessPoolExecutor
+                from itertools import islice
+
+                # feed the pool from the generator in batches, with at most two
+                # batches per worker in flight, so the archive is not read into
+                # memory ahead of the parsing; results are collected in order
+                pending = deque()
+                with ProcessPoolExecutor(max_workers=n_workers) as e:
+                    for batch in iter(lambda: list(islice(members, 256)), []):
+                        pending.append(
+                            e.submit(
+                                _parse_qm9_xyz_texts,
+                                batch,
+                                self.qm_parameters,
+                                self.thermochemical_references,
+                            )
+                        )
+                        if len(pending) >= 2 * n_workers:
+                            self.data.extend(pending.popleft().result())
+                    while pending:
+                        self.data.extend(pending.popleft().result())
+            else:
+                for text, name in members:
+                    self.data.append(
+                        _parse_qm9_xyz_text(
+                            text,
+                            name,
+                            self.qm_parameters,
+                            self.thermochemical_references,
+                        )
+                    )
+
+        self.data.sort(key=lambda x: x["name"])
+
+        # if unit outputs were defined perform conversion
+        if self.convert_units:
+            self._convert_units()
 
     def _process_downloaded(
         self,
@@ -533,6 +744,7 @@ class QM9Curation(DatasetCuration):
         max_records: Optional[int] = None,
         max_conformers_per_record: Optional[int] = None,
         total_conformers: Optional[int] = None,
+        n_workers: int = 1,
     ):
         """
         Processes a downloaded dataset: extracts relevant information into a list of dicts.
@@ -550,6 +762,9 @@ class QM9Curation(DatasetCuration):
         total_conformers: int, optional, default=None
             If set to an integer, 'n_t', the routine will only process the first 'n_t' conformers in total, useful for unit tests.
             Can be used in conjunction with max_records and max_conformers_per_record.
+        n_workers: int, optional, default=1
+            Number of processes used to parse the xyz files. Files are independent of each other;
+            records are appended in the same order regardless of the number of workers.
 
 
         Examples
@@ -589,11 +804,31 @@ class QM9Curation(DatasetCuration):
                 "max_conformers_per_record is not used for QM9 dataset as there is only one conformer per record. Using a value of 1"
             )
 
-        for i, file in enumerate(
-            tqdm(files[0:n_max], desc="processing", total=len(files))
-        ):
-            data_temp = self._parse_xyzfile(f"{local_path_dir}/{file}")
-            self.data.append(data_temp)
+        file_paths = [f"{local_path_dir}/{file}" for file in files[0:n_max]]
+        if n_workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            from functools import partial
+
+            # the parser is a module-level function, so only the file paths and
+            # the unit tables are sent to the workers, not the curation object
+            parse = partial(
+                _parse_qm9_xyzfile,
+                qm_parameters=self.qm_parameters,
+                thermochemical_references=self.thermochemical_references,
+            )
+            # map preserves the input order, so records stay sorted by name
+            with ProcessPoolExecutor(max_workers=n_workers) as e:
+                parsed = e.map(
+                    parse,
+                    file_paths,
+                    chunksize=max(1, len(file_paths) // (4 * n_workers)),
+                )
+                for data_temp in tqdm(parsed, desc="processing", total=n_max):
+                    self.data.append(data_temp)
+        else:
+            for file_path in tqdm(file_paths, desc="processing", total=n_max):
+                data_temp = self._parse_xyzfile(file_path)
+                self.data.append(data_temp)
 
         # if unit outputs were defined perform conversion
         if self.convert_units:
@@ -610,6 +845,7 @@ class QM9Curation(DatasetCuration):
         max_records: Optional[int] = None,
         max_conformers_per_record: Optional[int] = None,
         total_conformers: Optional[int] = None,
+        n_workers: int = 1,
     ) -> None:
         """
         Downloads the dataset, extracts relevant information, and writes an hdf5 file.
@@ -628,6 +864,8 @@ class QM9Curation(DatasetCuration):
         total_conformers: int, optional, default=None
             If set to an integer, 'n_t', the routine will only process the first 'n_t' conformers in total, useful for unit tests.
             Can be used in conjunction with max_records and max_conformers_per_record.
+        n_workers: int, optional, default=1
+            Number of processes used to parse the extracted xyz files.
 
         Note for qm9, only a single conformer is present per record, so max_records and total_conformers behave the same way,
         and max_conformers_per_record does not alter the behavior (i.e., it is always 1).
@@ -659,23 +897,14 @@ class QM9Curation(DatasetCuration):
         # clear out the data array before we process
         self._clear_data()
 
-        # untar the dataset
-        from modelforge.utils.misc import extract_tarred_file
-
-        # extract the tar.bz2 file into the local_cache_dir
-        # creating a directory called qm9_xyz_files to hold the contents
-        extract_tarred_file(
-            input_path_dir=self.local_cache_dir,
-            file_name=self.dataset_filename,
-            output_path_dir=f"{self.local_cache_dir}/qm9_xyz_files",
-            mode="r:bz2",
-        )
-
-        self._process_downloaded(
-            f"{self.local_cache_dir}/qm9_xyz_files",
+        # parse the xyz files directly from the tar.bz2 file, rather than
+        # extracting the ~134k files into the local_cache_dir first
+        self._process_downloaded_archive(
+            f"{self.local_cache_dir}/{self.dataset_filename}",
             max_records,
             max_conformers_per_record,
             total_conformers,
+            n_workers=n_workers,
         )
 
         # generate the hdf5 file
@@ -1,4 +1,7 @@
-from modelforge.curation.curation_baseclass import DatasetCuration
+from modelforge.curation.curation_baseclass import (
+    DatasetCuration,
+    HDF5_READ_CHUNK_CACHE,
+)
 from typing import Optional
 from loguru import logger
 from openff.units import unit
@@ -234,21 +237,23 @@ class SPICE1Curation(DatasetCuration):
         --------
         """
         import h5py
+        from itertools import islice
         from tqdm import tqdm
 
         input_file_name = f"{local_path_dir}/{name}"
 
         need_to_reshape = {"formation_energy": True, "dft_total_energy": True}
-        with h5py.File(input_file_name, "r") as hf:
-            names = list(hf.keys())
+        with h5py.File(input_file_name, "r", **HDF5_READ_CHUNK_CACHE) as hf:
+            # iterate the file's groups directly rather than building a
+            # list of all record names first
             if max_records is None:
-                n_max = len(names)
+                n_max = len(hf)
             elif max_records is not None:
                 n_max = max_records
 
             conformers_counter = 0
 
-            for i, name in tqdm(enumerate(names[0:n_max]), total=n_max):
+            for i, name in tqdm(enumerate(islice(hf, n_max)), total=n_max):
                 if total_conformers is not None:
                     if conformers_counter >= total_conformers:
                         break
@@ -256,8 +261,6 @@ class SPICE1Curation(DatasetCuration):
                 # Extract the total number of conformations for a given molecule
                 conformers_per_record = hf[name]["conformations"].shape[0]
 
-                keys_list = list(hf[name].keys())
-
                 # temp dictionary for ANI-1x and ANI-1ccx data
                 ds_temp = {}
 
@@ -285,22 +288,28 @@ class SPICE1Curation(DatasetCuration):
                     if param_in == "geometry":
                         param_in = "conformations"
 
-                    if param_in in keys_list:
-                        temp = hf[name][param_in][()]
+                    if param_in in hf[name]:
+                        # only read the conformers we keep, directly into a
+                        # preallocated buffer
+                        dataset = hf[name][param_in]
+                        temp = np.empty(
+                            (conformers_per_record,) + dataset.shape[1:],
+                            dtype=dataset.dtype,
+                        )
+                        if conformers_per_record > 0:
+                            dataset.read_direct(
+                                temp, source_sel=np.s_[0:conformers_per_record]
+                            )
                         if param_in in need_to_reshape:
                             temp = temp.reshape(-1, 1)
 
-                        temp = temp[0:conformers_per_record]
                         param_unit = param_data["u_in"]
                         if param_unit is not None:
                             # check that units in the hdf5 file match those we have defined in self.qm_parameters
                             try:
-                                assert (
-                                    hf[name][param_in].attrs["units"]
-                                    == param_data["u_in"]
-                                )
+                                assert dataset.attrs["units"] == param_data["u_in"]
                             except:
-                                msg1 = f'unit mismatch: units in hdf5 file: {hf[name][param_in].attrs["units"]},'
+                                msg1 = f'unit mismatch: units in hdf5 file: {dataset.attrs["units"]},'
                                 msg2 = f'units defined in curation class: {param_data["u_in"]}.'
 
                                 raise AssertionError(f"{msg1} {msg2}")
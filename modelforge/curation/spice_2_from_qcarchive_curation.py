@@ -68,6 +68,9 @@ class SPICE2Curation(DatasetCuration):
     release_version: str, optional, default='2'
         Version of the SPICE dataset to fetch from the MOLSSI QCArchive.
         Currently doesn't do anything
+    storage_dtype: str, optional, default=None
+        Floating point dtype (e.g., "float16") used to store per-atom series in the hdf5 file.
+        If None, arrays are written with their own dtype.
     Examples
     --------
     >>> spice2_data = SPICE2Curation(hdf5_file_name='spice2_dataset.hdf5',
@@ -83,12 +86,14 @@ class SPICE2Curation(DatasetCuration):
         local_cache_dir: str,
         convert_units: bool = True,
         release_version: str = "2",
+        storage_dtype: Optional[str] = None,
     ):
         super().__init__(
             hdf5_file_name=hdf5_file_name,
             output_file_dir=output_file_dir,
             local_cache_dir=local_cache_dir,
             convert_units=convert_units,
+            storage_dtype=storage_dtype,
         )
         self.release_version = release_version
 
@@ -48,10 +48,17 @@ class TorchDataset(torch.utils.data.Dataset[BatchData]):
         """
         super().__init__()
         self.preloaded = preloaded
+        if isinstance(dataset, np.lib.npyio.NpzFile):
+            # NpzFile reads and parses an array from the archive on every key
+            # access, and several keys are accessed more than once below
+            keys = {"atomic_subsystem_counts", "n_confs"}.union(
+                name for name in vars(property_name).values() if name is not None
+            )
+            dataset = {key: dataset[key] for key in keys if key in dataset.files}
         self.properties_of_interest = self._load_properties(dataset, property_name)
 
         self.number_of_records = len(dataset["atomic_subsystem_counts"])
-        self.number_of_atoms = len(dataset["atomic_numbers"])
+        self.number_of_atoms = len(dataset[property_name.atomic_numbers])
         self.length = len(self.properties_of_interest["E"])
 
         # Prepare indices for atom and conformer data
@@ -321,7 +328,9 @@ class HDF5Dataset(ABC):
                 with open(
                     f"{self.local_cache_dir}/{self.hdf5_data_file['name']}", "wb"
                 ) as out_file:
-                    shutil.copyfileobj(gz_file, out_file)
+                    # decompress in large blocks; the default 64 KiB copy buffer
+                    # makes the zlib decode dominated by per-call overhead
+                    shutil.copyfileobj(gz_file, out_file, length=16 * 1024 * 1024)
 
             # now that the file is written we can safely remove the lockfile
             import os
@@ -380,32 +389,29 @@ class HDF5Dataset(ABC):
             with OpenWithLock(f"{file_path}/{file_name}.lockfile", "w") as fl:
                 with open(f"{file_path}/{file_name}", "r") as f:
                     self._npz_metadata = json.load(f)
+            os.remove(f"{file_path}/{file_name}.lockfile")
 
-                    if not self._check_lists(
-                        self._npz_metadata["data_keys"], self.properties_of_interest
-                    ):
-                        log.warning(
-                            f"Data keys used to generate {file_path}/{file_name} ({self._npz_metadata['data_keys']})"
-                        )
-                        log.warning(
-                            f"do not match data loader ({self.properties_of_interest})."
-                        )
-                        return False
+            if not self._check_lists(
+                self._npz_metadata["data_keys"], self.properties_of_interest
+            ):
+                log.warning(
+                    f"Data keys used to generate {file_path}/{file_name} ({self._npz_metadata['data_keys']})"
+                )
+                log.warning(
+                    f"do not match data loader ({self.properties_of_interest})."
+                )
+                return False
 
-                    if self._npz_metadata["element_filter"] != str(self.element_filter):
-                        log.warning(
-                            "Element filter for hdf5 file used to generate npz file does not match current file in dataloader."
-                        )
+            if self._npz_metadata["element_filter"] != str(self.element_filter):
+                log.warning(
+                    "Element filter for hdf5 file used to generate npz file does not match current file in dataloader."
+                )
 
-                    if (
-                        self._npz_metadata["hdf5_checksum"]
-                        != self.hdf5_data_file["md5"]
-                    ):
-                        log.warning(
-                            f"Checksum for hdf5 file used to generate npz file does not match current file in dataloader."
-                        )
-                        return False
-            os.remove(f"{file_path}/{file_name}.lockfile")
+            if self._npz_metadata["hdf5_checksum"] != self.hdf5_data_file["md5"]:
+                log.warning(
+                    f"Checksum for hdf5 file used to generate npz file does not match current file in dataloader."
+                )
+                return False
         return True
 
     @staticmethod
@@ -651,6 +657,13 @@ class HDF5Dataset(ABC):
 
                             for value in series_atom_data.keys():
                                 record_array = hf[record][value][()][~configs_nan]
+                                # per-atom series may be stored in reduced
+                                # precision (see dict_to_hdf5 storage_dtype)
+                                if (
+                                    np.issubdtype(record_array.dtype, np.floating)
+                                    and record_array.dtype.itemsize < 4
+                                ):
+                                    record_array = record_array.astype(np.float32)
                                 if "u" in hf[record][value].attrs:
                                     units = hf[record][value].attrs["u"]
                                     if units != "dimensionless":
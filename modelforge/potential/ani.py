@@ -61,6 +61,27 @@ ATOMIC_NUMBER_TO_INDEX_MAP = {
 }
 
 
+def atomic_number_lookup_table() -> torch.Tensor:
+    """
+    Generate a tensor mapping atomic numbers to the internal species index.
+
+    The tensor is indexed directly with atomic numbers (i.e., its size is the
+    largest supported atomic number + 1); unsupported elements map to -1.
+
+    Returns
+    -------
+    torch.Tensor
+        The lookup tensor.
+    """
+    maximum_atomic_number = max(ATOMIC_NUMBER_TO_INDEX_MAP.keys())
+    lookup_tensor = torch.full((maximum_atomic_number + 1,), -1, dtype=torch.long)
+
+    # Populate the lookup tensor with indices from the map
+    for atomic_number, index in ATOMIC_NUMBER_TO_INDEX_MAP.items():
+        lookup_tensor[atomic_number] = index
+    return lookup_tensor
+
+
 class ANIRepresentation(nn.Module):
     """
     Compute the Atomic Environment Vectors (AEVs) for the ANI architecture. AEVs
@@ -178,19 +199,26 @@ class ANIRepresentation(nn.Module):
         pair_indices = torch.repeat_interleave(pair_sizes)
         central_atom_index = uniqued_central_atom_index.index_select(0, pair_indices)
 
-        # do local combinations within unique key, assuming sorted
-        m = counts.max().item() if counts.numel() > 0 else 0
-        n = pair_sizes.shape[0]
-        intra_pair_indices = (
-            torch.tril_indices(m, m, -1, device=ai1.device)
-            .unsqueeze(1)
-            .expand(-1, n, -1)
-        )
-        mask = (
-            torch.arange(intra_pair_indices.shape[2], device=ai1.device)
-            < pair_sizes.unsqueeze(1)
-        ).flatten()
-        sorted_local_index12 = intra_pair_indices.flatten(1, 2)[:, mask]
+        # do local combinations within unique key, assuming sorted. The k-th
+        # pair of a central atom is the k-th entry of the strictly lower
+        # triangle in row-major order, i.e. (a, b) with a * (a - 1) / 2 <= k
+        # and b = k - a * (a - 1) / 2. Solving for a in closed form avoids
+        # materializing a [2, n_centers, max_pairs] index grid.
+        pair_offsets = ANIRepresentation._cumsum_from_zero(pair_sizes)
+        local_pair = torch.arange(
+            pair_indices.shape[0], device=ai1.device
+        ) - pair_offsets.index_select(0, pair_indices)
+        row = torch.floor(
+            (1.0 + torch.sqrt(8.0 * local_pair.to(torch.float64) + 1.0)) / 2.0
+        ).to(local_pair.dtype)
+        # guard against rounding in the square root
+        triangle = torch.div(row * (row - 1), 2, rounding_mode="trunc")
+        row = row - (triangle > local_pair).to(row.dtype)
+        row = row + (
+            torch.div((row + 1) * row, 2, rounding_mode="trunc") <= local_pair
+        ).to(row.dtype)
+        column = local_pair - torch.div(row * (row - 1), 2, rounding_mode="trunc")
+        sorted_local_index12 = torch.stack((row, column))
         sorted_local_index12 += ANIRepresentation._cumsum_from_zero(
             counts
         ).index_select(0, pair_indices)
@@ -270,11 +298,12 @@ class ANIRepresentation(nn.Module):
         """
 
         # ----------------- Radial symmetry vector ---------------- #
-        # compute radial aev
-        radial_feature_vector = self.radial_symmetry_functions(pairlist_output.d_ij)
-        # Apply cutoff to radial features
-        rcut_ij = self.cutoff_module(pairlist_output.d_ij)
-        radial_feature_vector = radial_feature_vector * rcut_ij
+        # compute radial aev and apply the cutoff to the radial features
+        radial_feature_vector = (
+            self.radial_symmetry_functions.forward_with_cosine_cutoff(
+                pairlist_output.d_ij, self.cutoff_module.cutoff
+            )
+        )
 
         # Process output to prepare for angular symmetry vector
         postprocessed_radial_aev_and_additional_data = self._postprocess_radial_aev(
@@ -410,26 +439,34 @@ class ANIRepresentation(nn.Module):
         # fixed dimensinos (nr_of_supported_elements, 16 (represents number of
         # radial symmetry functions)) for each **element** per atom (in a pair)
 
-        # this is a magic indexing function that works
-        index12 = atom_index12 * self.nr_of_supported_elements + species12.flip(0)
-        radial_aev.index_add_(0, index12[0], radial_feature_vector)
-        radial_aev.index_add_(0, index12[1], radial_feature_vector)
+        # this is a magic indexing function that works: atom i of a pair is
+        # binned by the species of atom j and vice versa. The two rows are
+        # combined with the opposite species row directly instead of flipping
+        # species12 first.
+        index12 = torch.cat(
+            (
+                atom_index12[0] * self.nr_of_supported_elements + species12[1],
+                atom_index12[1] * self.nr_of_supported_elements + species12[0],
+            )
+        )
+        # both atoms of a pair receive the same contribution, accumulate them
+        # with a single index_add_ over the concatenated indices
+        radial_aev.index_add_(0, index12, radial_feature_vector.repeat(2, 1))
 
         radial_aev = radial_aev.reshape(number_of_atoms, radial_length)
 
-        # compute new neighbors with radial_cutoff
-        distances = pairlist_output.d_ij.T.flatten()
-        even_closer_indices = (
-            (distances <= self.maximum_interaction_radius_for_angular_features)
-            .nonzero()
-            .flatten()
+        # compute new neighbors with radial_cutoff, the same boolean mask
+        # selects the pairs from all three tensors
+        even_closer = (
+            pairlist_output.d_ij.view(-1)
+            <= self.maximum_interaction_radius_for_angular_features
         )
 
         return {
             "radial_aev": radial_aev,
-            "atom_index12": atom_index12.index_select(1, even_closer_indices),
-            "species12": species12.index_select(1, even_closer_indices),
-            "r_ij": pairlist_output.r_ij.index_select(0, even_closer_indices),
+            "atom_index12": atom_index12[:, even_closer],
+            "species12": species12[:, even_closer],
+            "r_ij": pairlist_output.r_ij[even_closer],
         }
 
     def _preprocess_angular_aev(self, data: Dict[str, torch.Tensor]):
@@ -775,15 +812,7 @@ class ANI2xCore(torch.nn.Module):
         # ----- ATOMIC NUMBER LOOKUP --------
         # Create a tensor for direct lookup. The size of this tensor will be
         # # the max atomic number in map. Initialize with a default value (e.g., -1 for not found).
-
-        maximum_atomic_number = max(ATOMIC_NUMBER_TO_INDEX_MAP.keys())
-        lookup_tensor = torch.full((maximum_atomic_number + 1,), -1, dtype=torch.long)
-
-        # Populate the lookup tensor with indices from your map
-        for atomic_number, index in ATOMIC_NUMBER_TO_INDEX_MAP.items():
-            lookup_tensor[atomic_number] = index
-
-        self.register_buffer("lookup_tensor", lookup_tensor)
+        self.register_buffer("lookup_tensor", atomic_number_lookup_table())
         # Apply the custom weight initialization
         self.apply(init_params)
 
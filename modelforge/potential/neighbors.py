@@ -62,38 +62,18 @@ class Pairlist(torch.nn.Module):
         # get device that passed tensors lives on, initialize on the same device
         device = atomic_subsystem_indices.device
 
-        # if there is only one molecule, we do not need to use additional looping and offsets
-        if torch.sum(atomic_subsystem_indices) == 0:
+        # if there is only one molecule, the unique pairs are the upper triangle
+        if self.only_unique_pairs and torch.sum(atomic_subsystem_indices) == 0:
             n = len(atomic_subsystem_indices)
-            if self.only_unique_pairs:
-                i_final_pairs, j_final_pairs = torch.triu_indices(
-                    n, n, 1, device=device
-                )
-            else:
-                # Repeat each number n-1 times for i_indices
-                i_final_pairs = torch.repeat_interleave(
-                    torch.arange(n, device=device),
-                    repeats=n - 1,
-                )
-
-                # Correctly construct j_indices
-                j_final_pairs = torch.cat(
-                    [
-                        torch.cat(
-                            (
-                                torch.arange(i, device=device),
-                                torch.arange(i + 1, n, device=device),
-                            )
-                        )
-                        for i in range(n)
-                    ]
-                )
+            i_final_pairs, j_final_pairs = torch.triu_indices(n, n, 1, device=device)
 
         else:
-            # if we have more than one molecule, we will take into account molecule size and offsets when
-            # calculating pairs, as using the approach above is not memory efficient for datasets with large molecules
-            # and/or larger batch sizes; while not likely a problem on higher end GPUs with large amounts of memory
-            # cheaper commodity and mobile GPUs may have issues
+            # we take into account molecule size and offsets when calculating
+            # pairs, as generating all n^2 pairs and masking is not memory
+            # efficient for datasets with large molecules and/or larger batch
+            # sizes; while not likely a problem on higher end GPUs with large
+            # amounts of memory cheaper commodity and mobile GPUs may have
+            # issues
 
             # atomic_subsystem_indices are always numbered from 0 to n_molecules
             # - 1 e.g., a single molecule will be [0, 0, 0, 0 ... ] and a batch
@@ -106,36 +86,37 @@ class Pairlist(torch.nn.Module):
             # as we have no values for 0, 1, 2
             # using a combination of unique and argsort would make this work for any numbering ordering
             # but that is not how the data ends up being structured internally, and thus is not needed
+            atomic_subsystem_indices = atomic_subsystem_indices.to(torch.int64)
             repeats = torch.bincount(atomic_subsystem_indices)
-            offsets = torch.cat(
-                (torch.tensor([0], device=device), torch.cumsum(repeats, dim=0)[:-1])
-            )
+            offsets = torch.cumsum(repeats, dim=0) - repeats
+
+            # every atom is paired with all atoms of its molecule (including
+            # itself), i.e., atom i has `atom_repeats[i]` partners starting
+            # at index `atom_offsets[i]`
+            atom_repeats = repeats[atomic_subsystem_indices]
+            atom_offsets = offsets[atomic_subsystem_indices]
 
-            i_indices = torch.cat(
-                [
-                    torch.repeat_interleave(
-                        torch.arange(o, o + r, device=device), repeats=r
-                    )
-                    for r, o in zip(repeats, offsets)
-                ]
+            i_indices = torch.repeat_interleave(
+                torch.arange(len(atomic_subsystem_indices), device=device),
+                atom_repeats,
             )
-            j_indices = torch.cat(
-                [
-                    torch.cat([torch.arange(o, o + r, device=device) for _ in range(r)])
-                    for r, o in zip(repeats, offsets)
-                ]
+            # position of each pair within the block of partners of atom i
+            block_starts = torch.cumsum(atom_repeats, dim=0) - atom_repeats
+            position_in_block = torch.arange(
+                i_indices.shape[0], device=device
+            ) - torch.repeat_interleave(block_starts, atom_repeats)
+            j_indices = (
+                torch.repeat_interleave(atom_offsets, atom_repeats) + position_in_block
             )
 
             if self.only_unique_pairs:
                 # filter out pairs that are not unique
                 unique_pairs_mask = i_indices < j_indices
-                i_final_pairs = i_indices[unique_pairs_mask]
-                j_final_pairs = j_indices[unique_pairs_mask]
             else:
                 # filter out identical values
                 unique_pairs_mask = i_indices != j_indices
-                i_final_pairs = i_indices[unique_pairs_mask]
-                j_final_pairs = j_indices[unique_pairs_mask]
+            i_final_pairs = i_indices[unique_pairs_mask]
+            j_final_pairs = j_indices[unique_pairs_mask]
 
         # concatenate to form final (2, n_pairs) tensor
         pair_indices = torch.stack((i_final_pairs, j_final_pairs))
@@ -226,11 +207,10 @@ class Pairlist(torch.nn.Module):
         torch.Tensor
             Displacement vectors between atom pairs. Shape: [n_pairs, 3].
         """
-        # Select the pairs of atom coordinates from the positions
-        selected_positions = positions.index_select(0, pair_indices.view(-1)).view(
-            2, -1, 3
+        # Select the coordinates of the second and first atom of each pair
+        return positions.index_select(0, pair_indices[1]) - positions.index_select(
+            0, pair_indices[0]
         )
-        return selected_positions[1] - selected_positions[0]
 
     def calculate_d_ij(self, r_ij: torch.Tensor) -> torch.Tensor:
         """
@@ -246,7 +226,7 @@ class Pairlist(torch.nn.Module):
         torch.Tensor
             Euclidean distances. Shape: [n_pairs, 1].
         """
-        return r_ij.norm(dim=1).unsqueeze(1)
+        return torch.linalg.vector_norm(r_ij, dim=1, keepdim=True)
 
     def forward(
         self,
@@ -332,7 +312,7 @@ class OrthogonalDisplacementFunction(torch.nn.Module):
                 torch.remainder(r_ij + box_lengths / 2, box_lengths) - box_lengths / 2
             )
 
-        d_ij = torch.norm(r_ij, dim=1, keepdim=True, p=2)
+        d_ij = torch.linalg.vector_norm(r_ij, dim=1, keepdim=True)
         return r_ij, d_ij
 
 
@@ -758,12 +738,10 @@ class NeighborListForTraining(torch.nn.Module):
         torch.Tensor
             Displacement vectors between atom pairs. Shape: [n_pairs, 3].
         """
-        # Select the pairs of atom coordinates from the positions
-
-        selected_positions = positions.index_select(0, pair_indices.view(-1)).view(
-            2, -1, 3
+        # Select the coordinates of the second and first atom of each pair
+        return positions.index_select(0, pair_indices[1]) - positions.index_select(
+            0, pair_indices[0]
         )
-        return selected_positions[1] - selected_positions[0]
 
     @torch.jit.export
     def _set_strategy(self, strategy: str = "brute_nsq", skin: float = 0.1):
@@ -795,7 +773,7 @@ class NeighborListForTraining(torch.nn.Module):
         torch.Tensor
             Euclidean distances. Shape: [n_pairs, 1].
         """
-        return r_ij.norm(dim=1).unsqueeze(1)
+        return torch.linalg.vector_norm(r_ij, dim=1, keepdim=True)
 
     def _calculate_interacting_pairs(
         self,
@@ -822,16 +800,18 @@ class NeighborListForTraining(torch.nn.Module):
         """
 
         r_ij = self.calculate_r_ij(pair_indices, positions)
-        d_ij = self.calculate_d_ij(r_ij)
 
-        in_cutoff = (d_ij <= self.cutoff).squeeze()
+        # compare squared distances against the squared cutoff, so that the
+        # square root is only taken for the pairs within the cutoff
+        in_cutoff = (r_ij * r_ij).sum(dim=1) <= self.cutoff * self.cutoff
         # Get the atom indices within the cutoff
         pair_indices_within_cutoff = pair_indices[:, in_cutoff]
+        r_ij = r_ij[in_cutoff]
 
         return PairlistData(
             pair_indices=pair_indices_within_cutoff,
-            d_ij=d_ij[in_cutoff],
-            r_ij=r_ij[in_cutoff],
+            d_ij=self.calculate_d_ij(r_ij),
+            r_ij=r_ij,
         )
 
     def forward(self, data: Union[NNPInput, NamedTuple]) -> PairlistData:
@@ -169,7 +169,7 @@ class AngularSymmetryFunction(nn.Module):
 
         """
         # vectors12 has shape: (2, n_pairs, 3)
-        distances12 = vectors12.norm(p=2, dim=-1)  # Shape: (2, n_pairs)
+        distances12 = torch.linalg.vector_norm(vectors12, dim=-1)  # Shape: (2, n_pairs)
         distances_sum = distances12.sum(dim=0) / 2  # Shape: (n_pairs,)
         fcj12 = self.cosine_cutoff(distances12)  # Shape: (2, n_pairs)
         fcj12_prod = fcj12.prod(dim=0)  # Shape: (n_pairs,)
@@ -413,6 +413,72 @@ class GaussianRadialBasisFunctionWithScaling(RadialBasisFunction):
         diff = distances - self.radial_basis_centers
         return diff / self.radial_scale_factor
 
+    def forward_with_cosine_cutoff(
+        self, distances: torch.Tensor, cutoff: torch.Tensor
+    ) -> torch.Tensor:
+        """
+        Compute the radial basis functions multiplied by the cosine cutoff
+        (see `CosineAttenuationFunction`) in a single pass over the distances.
+
+        Parameters
+        ---------
+        distances: torch.Tensor, shape [number_of_pairs, 1]
+            Distances between atoms in each pair in nanometers.
+        cutoff: torch.Tensor
+            The cutoff distance in nanometers.
+
+        Returns
+        ---------
+        torch.Tensor, shape [number_of_pairs, number_of_radial_basis_functions]
+            Output of the radial basis functions, attenuated by the cutoff.
+        """
+        return gaussian_radial_basis_with_cosine_cutoff(
+            distances,
+            self.radial_basis_centers,
+            self.radial_scale_factor,
+            self.prefactor,
+            cutoff,
+        )
+
+
+def gaussian_radial_basis_with_cosine_cutoff(
+    distances: torch.Tensor,
+    centers: torch.Tensor,
+    scale_factors: torch.Tensor,
+    prefactor: torch.Tensor,
+    cutoff: torch.Tensor,
+) -> torch.Tensor:
+    """
+    Elementwise Gaussian radial basis times cosine cutoff. Kept as a single
+    expression so that the elementwise operations can be fused when the
+    calling module is scripted.
+
+    Parameters
+    ----------
+    distances : torch.Tensor
+        Pairwise distances in nanometer. Shape: [n_pairs, 1]
+    centers : torch.Tensor
+        Centers of the Gaussians in nanometer. Shape: [number_of_radial_basis_functions]
+    scale_factors : torch.Tensor
+        Scale factors of the Gaussians in nanometer. Shape: [number_of_radial_basis_functions]
+    prefactor : torch.Tensor
+        Scalar factor by which the output is multiplied.
+    cutoff : torch.Tensor
+        The cutoff distance in nanometer.
+
+    Returns
+    -------
+    torch.Tensor
+        Attenuated radial basis. Shape: [n_pairs, number_of_radial_basis_functions]
+    """
+    nondimensionalized_distances = (distances - centers) / scale_factors
+    attenuation = (
+        0.5
+        * (torch.cos(distances * math.pi / cutoff) + 1.0)
+        * (distances < cutoff).to(distances.dtype)
+    )
+    return prefactor * torch.exp(-(nondimensionalized_distances**2)) * attenuation
+
 
 class SchnetRadialBasisFunction(GaussianRadialBasisFunctionWithScaling):
     """
@@ -478,9 +544,8 @@ class SchnetRadialBasisFunction(GaussianRadialBasisFunctionWithScaling):
             dtype=dtype,
         )
 
-        widths = torch.abs(scale_factors[1] - scale_factors[0]) * torch.ones_like(
-            scale_factors
-        )
+        # expanded view; the multiplication below materializes the buffer
+        widths = (scale_factors[1] - scale_factors[0]).abs().expand_as(scale_factors)
 
         scale_factors = math.sqrt(2) * widths
         return scale_factors
@@ -2,7 +2,7 @@
 SAKE - Spatial Attention Kinetic Networks with E(n) Equivariance
 """
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import torch
 import torch.nn as nn
@@ -11,7 +11,7 @@ from loguru import logger as log
 from modelforge.utils.prop import NNPInput
 from modelforge.potential.neighbors import PairlistData
 
-from .utils import DenseWithCustomDist, scatter_softmax
+from .utils import DenseWithCustomDist, scatter_softmax, segment_lengths_if_sorted
 from .representation import PhysNetRadialBasisFunction
 
 
@@ -133,8 +133,14 @@ class SAKECore(torch.nn.Module):
         x = data.positions
         v = torch.zeros_like(x)
 
+        # all interaction modules share the pair list; determine the segment
+        # lengths of the receiver indices once per batch instead of per module
+        counts = segment_lengths_if_sorted(
+            pairlist_output.pair_indices[0], int(x.size(dim=0))
+        )
+
         for interaction_mod in self.interaction_modules:
-            h, x, v = interaction_mod(h, x, v, pairlist_output.pair_indices)
+            h, x, v = interaction_mod(h, x, v, pairlist_output.pair_indices, counts)
 
         return {
             "per_atom_scalar_representation": h,
@@ -486,6 +492,7 @@ class SAKEInteraction(nn.Module):
         idx_i: torch.Tensor,
         idx_j: torch.Tensor,
         nr_atoms: int,
+        counts: Optional[torch.Tensor] = None,
     ):
         """Compute semantic attention. Softmax is over all senders connected to a receiver.
 
@@ -501,6 +508,8 @@ class SAKEInteraction(nn.Module):
             Indices of the sender nodes. Shape [nr_pairs, ].
         nr_atoms : int
             Number of atoms in all systems.
+        counts : Optional[torch.Tensor]
+            Number of pairs per receiver if idx_i is sorted, see `segment_lengths_if_sorted`. Shape [nr_atoms, ].
 
         Returns
         -------
@@ -516,6 +525,7 @@ class SAKEInteraction(nn.Module):
             expanded_idx_i,
             dim=0,
             dim_size=nr_atoms,
+            counts=counts,
         )
         # p: nr_pairs, f: nr_edge_basis, h: nr_heads
         return torch.reshape(
@@ -524,7 +534,12 @@ class SAKEInteraction(nn.Module):
         )
 
     def forward(
-        self, h: torch.Tensor, x: torch.Tensor, v: torch.Tensor, pairlist: torch.Tensor
+        self,
+        h: torch.Tensor,
+        x: torch.Tensor,
+        v: torch.Tensor,
+        pairlist: torch.Tensor,
+        counts: Optional[torch.Tensor] = None,
     ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         """Compute interaction layer output.
 
@@ -537,6 +552,9 @@ class SAKEInteraction(nn.Module):
         v : torch.Tensor
             Input velocity (equivariant) atomic embeddings. Shape [nr_of_atoms_in_systems, geometry_basis].
         pairlist : torch.Tensor, shape (2, nr_pairs)
+        counts : Optional[torch.Tensor]
+            Number of pairs per receiver atom if the receiver indices are sorted, as computed once per batch
+            by `SAKECore`. If None, the softmax uses scatter operations.
 
         Returns
         -------
@@ -551,7 +569,7 @@ class SAKEInteraction(nn.Module):
 
         h_ij_edge = self.update_edge(h[idx_j], h[idx_i], d_ij)
         h_ij_semantic = self.get_semantic_attention(
-            h_ij_edge, idx_i, idx_j, nr_of_atoms_in_all_systems
+            h_ij_edge, idx_i, idx_j, nr_of_atoms_in_all_systems, counts
         )
         del h_ij_edge
         h_i_semantic = self.aggregate(h_ij_semantic, idx_i, nr_of_atoms_in_all_systems)
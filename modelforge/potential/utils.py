@@ -347,11 +347,42 @@ def read_dataset_statistics(
         return dataset_statistic
 
 
+def segment_lengths_if_sorted(
+    index: torch.Tensor, dim_size: int
+) -> Optional[torch.Tensor]:
+    """
+    Return the number of entries per segment if `index` is sorted, else None.
+
+    Pair lists are generated sorted by the first atom of each pair; for these
+    the scatter operations in `scatter_softmax` can be replaced by segment
+    reductions over contiguous slices. The sortedness check synchronizes with
+    the device, so call this once per batch (e.g., next to the pair list) and
+    pass the result to every `scatter_softmax` call that uses the same index.
+
+    Parameters
+    ----------
+    index : torch.Tensor
+        One-dimensional index tensor.
+    dim_size : int
+        The number of segments, i.e., the size of the output dimension.
+
+    Returns
+    -------
+    Optional[torch.Tensor]
+        The length of each segment (shape [dim_size]) if `index` is sorted in
+        ascending order, otherwise None.
+    """
+    if index.numel() > 1 and not bool((index[1:] >= index[:-1]).all()):
+        return None
+    return torch.bincount(index, minlength=dim_size)
+
+
 def scatter_softmax(
     src: torch.Tensor,
     index: torch.Tensor,
     dim: int,
     dim_size: int,
+    counts: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     """
     Computes the softmax operation over values in the `src` tensor that share indices specified in the `index` tensor
@@ -376,6 +407,12 @@ def scatter_softmax(
         The axis along which to index. Default is `-1`.
     dim_size : int
         The number of classes, i.e., the number of unique indices in `index`.
+    counts : Optional[Tensor]
+        The number of elements per index (shape [dim_size]), as returned by
+        `segment_lengths_if_sorted`. If provided, `index` is assumed to be
+        sorted along `dim == 0` and identical for all other dimensions, and
+        the maximum and sum per index are computed with segment reductions
+        instead of scatters.
 
     Returns
     -------
@@ -403,6 +440,25 @@ def scatter_softmax(
         for (other_dim, other_dim_size) in enumerate(src.shape)
     ]
     index = index.to(torch.int64)
+    if counts is not None:
+        assert dim == 0, f"segment reduction requires dim == 0, got {dim}"
+        # index is sorted: reduce over contiguous segments and broadcast back
+        max_value_per_index = torch.segment_reduce(
+            src, "max", lengths=counts, axis=0, unsafe=True
+        )
+        max_per_src_element = max_value_per_index.repeat_interleave(counts, dim=0)
+
+        recentered_scores_exp = (src - max_per_src_element).exp()
+
+        sum_per_index = torch.segment_reduce(
+            recentered_scores_exp, "sum", lengths=counts, axis=0, unsafe=True
+        )
+        normalizing_constants = sum_per_index.repeat_interleave(counts, dim=0)
+
+        return recentered_scores_exp.div(normalizing_constants)
+
+    # NOTE: `scatter_reduce` and `scatter_add` are out-of-place, the same
+    # zero-initialized buffer is therefore used for both reductions
     zeros = torch.zeros(out_shape, dtype=src.dtype, device=src.device)
     max_value_per_index = zeros.scatter_reduce(
         dim, index, src, "amax", include_self=False
@@ -412,9 +468,7 @@ def scatter_softmax(
     recentered_scores = src - max_per_src_element
     recentered_scores_exp = recentered_scores.exp()
 
-    sum_per_index = torch.zeros(
-        out_shape, dtype=src.dtype, device=src.device
-    ).scatter_add(dim, index, recentered_scores_exp)
+    sum_per_index = zeros.scatter_add(dim, index, recentered_scores_exp)
     normalizing_constants = sum_per_index.gather(dim, index)
 
     return recentered_scores_exp.div(normalizing_constants)
@@ -642,11 +642,10 @@ def provide_reference_values_for_test_ani_test_compute_rsf_with_diagonal_batchin
         atom_index12 = neighbor_pairs_nopbc(
             species == -1, ani_coordinates_, radial_cutoff
         )
-        selected_coordinates = ani_coordinates.index_select(
-            0, atom_index12.view(-1)
-        ).view(2, -1, 3)
-        vec = selected_coordinates[0] - selected_coordinates[1]
-        distances = vec.norm(2, -1)
+        vec = ani_coordinates.index_select(
+            0, atom_index12[0]
+        ) - ani_coordinates.index_select(0, atom_index12[1])
+        distances = torch.linalg.vector_norm(vec, dim=-1)
 
         # ------------ ANI calculation ----------#
         from torchani.aev import radial_terms
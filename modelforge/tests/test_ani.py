@@ -1,9 +1,31 @@
 import pytest
+import torch
 from modelforge.tests.helper_functions import setup_potential_for_test
 from importlib import resources
 from modelforge.tests import data
 
+from modelforge.potential.ani import atomic_number_lookup_table
+
 file_path = resources.files(data) / f"torchani_parameters2.state"
+# maps atomic numbers to the species index used by torchani and modelforge
+_ANI_LOOKUP_TABLE = atomic_number_lookup_table()
+# methane coordinates in angstrom, built once at import
+_METHANE_COORDINATES = torch.tensor(
+    [
+        [0.03192167, 0.00638559, 0.01301679],
+        [-0.83140486, 0.39370209, -0.26395324],
+        [-0.66518241, -0.84461308, 0.20759389],
+        [0.45554739, 0.54289633, 0.81170881],
+        [0.66091919, -0.16799635, -0.91037834],
+    ],
+    dtype=torch.float32,
+)
+# distances (in angstrom) and radial basis settings (in nanometer) shared by
+# the radial symmetry function comparison against torchani
+_RSF_D_IJ = torch.tensor([[3.5201], [2.6756], [2.1641], [3.0990], [4.5180]])
+_RSF_MAX_DISTANCE = 0.5
+_RSF_MIN_DISTANCE = 0.08
+_RSF_NUMBER_OF_DIVISIONS = 8
 
 
 @pytest.fixture(scope="session")
@@ -12,33 +34,34 @@ def prep_temp_dir(tmp_path_factory):
     return fn
 
 
+@pytest.fixture(scope="session")
+def torchani_ani2x_model():
+    # loading the torchani parameters is expensive, build the model only once
+    torchani = pytest.importorskip("torchani")
+
+    model = torchani.models.ANI2x(periodic_table_index=False, model_index=0)
+    return model.eval()
+
+
 def setup_methane():
     import torch
 
     device = torch.device("cpu")
-    coordinates = torch.tensor(
-        [
-            [
-                [0.03192167, 0.00638559, 0.01301679],
-                [-0.83140486, 0.39370209, -0.26395324],
-                [-0.66518241, -0.84461308, 0.20759389],
-                [0.45554739, 0.54289633, 0.81170881],
-                [0.66091919, -0.16799635, -0.91037834],
-            ]
-        ],
-        requires_grad=True,
-        device=device,
+    coordinates = (
+        _METHANE_COORDINATES.to(device).unsqueeze(0).clone().requires_grad_(True)
     )
     # In periodic table, C = 6 and H = 1
-    species = torch.tensor([[1, 0, 0, 0, 0]], device=device)
+    atomic_numbers = torch.tensor([6, 1, 1, 1, 1], device=device)
+    # the torchani species index is obtained via the modelforge lookup table
+    species = _ANI_LOOKUP_TABLE.to(device)[atomic_numbers].unsqueeze(0)
     atomic_subsystem_indices = torch.tensor(
-        [0, 0, 0, 0, 0], dtype=torch.int32, device=device
+        [0, 0, 0, 0, 0], dtype=torch.int64, device=device
     )
 
     from modelforge.utils.prop import NNPInput
 
     nnp_input = NNPInput(
-        atomic_numbers=torch.tensor([6, 1, 1, 1, 1], device=device),
+        atomic_numbers=atomic_numbers,
         positions=coordinates.squeeze(0) / 10,
         atomic_subsystem_indices=atomic_subsystem_indices,
         per_system_total_charge=torch.tensor([0.0]),
@@ -52,52 +75,37 @@ def setup_two_methanes():
 
     device = torch.device("cpu")
 
-    coordinates = torch.tensor(
-        [
-            [
-                [0.03192167, 0.00638559, 0.01301679],
-                [-0.83140486, 0.39370209, -0.26395324],
-                [-0.66518241, -0.84461308, 0.20759389],
-                [0.45554739, 0.54289633, 0.81170881],
-                [0.66091919, -0.16799635, -0.91037834],
-            ],
-            [
-                [0.03192167, 0.00638559, 0.01301679],
-                [-0.83140486, 0.39370209, -0.26395324],
-                [-0.66518241, -0.84461308, 0.20759389],
-                [0.45554739, 0.54289633, 0.81170881],
-                [0.66091919, -0.16799635, -0.91037834],
-            ],
-        ],
-        requires_grad=True,
-        device=device,
+    coordinates = (
+        _METHANE_COORDINATES.to(device)
+        .unsqueeze(0)
+        .expand(2, -1, -1)
+        .contiguous()
+        .requires_grad_(True)
     )
-    # Specify the translation vector
-    translation_vector = torch.tensor([1.0, 1.0, 1.0], device=device)
-    # Translate the second "molecule" without in-place modification
-    translated_coordinates = (
-        coordinates.clone()
-    )  # Clone the tensor to avoid in-place modification
-    translated_coordinates[1] = translated_coordinates[1] + translation_vector
-
-    print(translated_coordinates)
+    # Translate the second "molecule" by (1, 1, 1), the per-molecule shift
+    # broadcasts over the atoms and avoids a clone and in-place update
+    molecule_shift = torch.tensor([[0.0], [1.0]], device=device).unsqueeze(-1)
+    translated_coordinates = coordinates + molecule_shift
 
     # In periodic table, C = 6 and H = 1
-    mf_species = torch.tensor([6, 1, 1, 1, 1, 6, 1, 1, 1, 1], device=device)
-    ani_species = torch.tensor([[1, 0, 0, 0, 0], [1, 0, 0, 0, 0]], device=device)
-    atomic_subsystem_indices = torch.tensor(
-        [0, 0, 0, 0, 0, 1, 1, 1, 1, 1], dtype=torch.int32, device=device
+    methane_species = torch.tensor([6, 1, 1, 1, 1], device=device)
+    mf_species = methane_species.repeat(2)
+    ani_species = (
+        _ANI_LOOKUP_TABLE.to(device)[methane_species]
+        .unsqueeze(0)
+        .expand(2, -1)
+        .contiguous()
     )
+    atomic_subsystem_indices = torch.arange(
+        2, dtype=torch.int64, device=device
+    ).repeat_interleave(5)
 
     atomic_numbers = mf_species
     from modelforge.utils.prop import NNPInput
 
     nnp_input = NNPInput(
         atomic_numbers=atomic_numbers,
-        positions=torch.cat(
-            (translated_coordinates[0], translated_coordinates[1]), dim=0
-        )
-        / 10,
+        positions=translated_coordinates.reshape(-1, 3) / 10,
         atomic_subsystem_indices=atomic_subsystem_indices,
         per_system_total_charge=torch.tensor([0.0, 0.0]),
     )
@@ -105,9 +113,8 @@ def setup_two_methanes():
 
 
 @pytest.mark.xfail
-def test_ani(prep_temp_dir):
+def test_ani(prep_temp_dir, torchani_ani2x_model):
     import torch
-    import torchani
 
     # NOTE: in the following the input data is scaled to provide both
     # torchani and modelforge ani the same input but in different units
@@ -119,11 +126,13 @@ def test_ani(prep_temp_dir):
     species, coordinates, device, mf_input = setup_two_methanes()
 
     # get single model
-    model = torchani.models.ANI2x(periodic_table_index=False, model_index=0)
-    # calculate energy for methane
-    energy = model((species, coordinates)).energies
-    # get per atom energy
-    w, torchani_atomic_energies = model.atomic_energies((species, coordinates))
+    model = torchani_ani2x_model
+    # the reference is forward-only, skip recording the autograd graph
+    with torch.inference_mode():
+        # calculate energy for methane
+        energy = model((species, coordinates)).energies
+        # get per atom energy
+        w, torchani_atomic_energies = model.atomic_energies((species, coordinates))
 
     # compare to reference energy
     assert torch.allclose(
@@ -206,8 +215,9 @@ def test_ani_against_torchani_reference(prep_temp_dir):
     )
     # load the original ani2x parameter set
     potential.load_state_dict(torch.load(file_path))
-    # compare to original ani2x dataset
-    atomic_energies = potential(mf_input)["per_atom_energy"]
+    # compare to original ani2x dataset, no gradients are needed here
+    with torch.inference_mode():
+        atomic_energies = potential(mf_input)["per_atom_energy"]
 
     assert torch.allclose(
         atomic_energies,
@@ -228,8 +238,6 @@ def test_ani_against_torchani_reference(prep_temp_dir):
         rtol=1e-2,
     )  # that's the atomic energies for the two methane molecules obtained with torchani
 
-    a = 7
-
 
 @pytest.mark.parametrize("mode", ["inference", "training"])
 def test_forward_and_backward(mode):
@@ -270,33 +278,61 @@ def test_representation():
         AniRadialBasisFunction,
         CosineAttenuationFunction,
     )
-    from openff.units import unit
     from .precalculated_values import (
         provide_reference_values_for_test_ani_test_compare_rsf,
     )
 
-    # set up relevant variables
-    d_ij = unit.Quantity(
-        torch.tensor([[3.5201], [2.6756], [2.1641], [3.0990], [4.5180]]), unit.angstrom
-    )
-    max_distance = unit.Quantity(5.0, unit.angstrom)
-    min_distance = unit.Quantity(0.8, unit.angstrom)
-    radial_dist_divisions = 8
-
     # pass parameters to the radial symmetry function
     rsf = AniRadialBasisFunction(
-        number_of_radial_basis_functions=radial_dist_divisions,
-        max_distance=max_distance.to(unit.nanometer).m,
-        min_distance=min_distance.to(unit.nanometer).m,
+        number_of_radial_basis_functions=_RSF_NUMBER_OF_DIVISIONS,
+        max_distance=_RSF_MAX_DISTANCE,
+        min_distance=_RSF_MIN_DISTANCE,
     )
 
-    calculated_rsf = rsf(d_ij.to(unit.nanometer).m)  # torch.Size([5,1, 8])
-    cutoff_module = CosineAttenuationFunction(max_distance.to(unit.nanometer).m)
-
-    rcut_ij = cutoff_module(d_ij.to(unit.nanometer).m)  # torch.Size([5])
-    calculated_rsf = calculated_rsf * rcut_ij
+    cutoff_module = CosineAttenuationFunction(_RSF_MAX_DISTANCE)
+    # radial symmetry function attenuated by the cutoff, torch.Size([5, 8])
+    with torch.inference_mode():
+        calculated_rsf = rsf.forward_with_cosine_cutoff(
+            _RSF_D_IJ / 10, cutoff_module.cutoff
+        )
 
     # get the precalculated output obtained from torchani for the same d_ij and
     # cutoff values
     reference_rsf = provide_reference_values_for_test_ani_test_compare_rsf()
     assert torch.allclose(calculated_rsf, reference_rsf, rtol=1e-4)
+
+
+def test_triple_by_molecule():
+    # every pair of neighbors sharing a central atom has to be enumerated
+    # exactly once
+    import itertools
+    import torch
+    from modelforge.potential.ani import ANIRepresentation
+
+    atom_pairs = torch.tensor([[0, 0, 0, 1, 1, 2], [1, 2, 3, 2, 3, 3]])
+    central_atom_index, pair_index12, sign12 = ANIRepresentation.triple_by_molecule(
+        atom_pairs
+    )
+
+    # each pair is identified by the central atom and the two other atoms
+    others = torch.where(
+        sign12 == 1, atom_pairs[1][pair_index12], atom_pairs[0][pair_index12]
+    )
+    calculated = {
+        (int(c), frozenset((int(j), int(k))))
+        for c, j, k in zip(central_atom_index, others[0], others[1])
+    }
+
+    number_of_atoms = 4
+    reference = set()
+    for center in range(number_of_atoms):
+        neighbors = [
+            int(b) if int(a) == center else int(a)
+            for a, b in atom_pairs.T
+            if center in (int(a), int(b))
+        ]
+        for j, k in itertools.combinations(neighbors, 2):
+            reference.add((center, frozenset((j, k))))
+
+    assert central_atom_index.shape[0] == len(reference)
+    assert calculated == reference
@@ -6,6 +6,7 @@ import importlib_resources as resources
 import numpy as np
 from modelforge.utils.misc import *
 import pint
+from functools import lru_cache
 
 from modelforge.curation.qm9_curation import QM9Curation
 from modelforge.curation.ani1x_curation import ANI1xCuration
@@ -18,6 +19,49 @@ from modelforge.curation.spice_2_curation import SPICE2Curation as SPICE2Curatio
 
 from modelforge.curation.curation_baseclass import dict_to_hdf5
 
+# the same handful of unit strings is parsed for every record; cache them
+_parse_expression = lru_cache(maxsize=None)(unit.parse_expression)
+
+
+def assert_quantity_allclose(actual, desired, units=None):
+    # same tolerances and broadcasting as np.isclose; quantities are compared
+    # by magnitude. If units is given, desired is a plain array in those units
+    # and only actual is converted, so no quantity is built for the reference
+    if units is not None:
+        actual = actual.m_as(units)
+    elif isinstance(actual, pint.Quantity):
+        desired = desired.m_as(actual.u)
+        actual = actual.m
+    # np.allclose is a single fused check; only build the detailed report of
+    # np.testing.assert_allclose when the arrays do not match
+    if np.allclose(actual, desired, rtol=1e-5, atol=1e-8):
+        return
+    np.testing.assert_allclose(
+        *np.broadcast_arrays(actual, desired), rtol=1e-5, atol=1e-8
+    )
+
+
+def _load_reference(name):
+    # reference arrays are stored as .npy files in tests/data/refs and
+    # memory-mapped read-only rather than written out as literals
+    return np.load(
+        str(
+            resources.files("modelforge").joinpath(
+                "tests", "data", "refs", f"{name}.npy"
+            )
+        ),
+        mmap_mode="r",
+    )
+
+
+@pytest.fixture(scope="session")
+def curation_data_dir():
+    # resolve the bundled test data directory to a filesystem path once per session
+    with resources.as_file(
+        resources.files("modelforge").joinpath("tests", "data")
+    ) as path:
+        yield path
+
 
 @pytest.fixture(scope="session")
 def prep_temp_dir(tmp_path_factory):
@@ -63,27 +107,22 @@ def test_dict_to_hdf5(prep_temp_dir):
     # read in the hdf5 file
     records = []
     with h5py.File(file_name_path, "r") as hf:
-        test_names = list(hf.keys())
-
         # validate names
-        assert test_names == ["test1", "test2"]
+        assert list(hf) == ["test1", "test2"]
 
-        for name in test_names:
+        for name, group in hf.items():
             temp_record = {}
             temp_record["name"] = name
-            properties = list(hf[name].keys())
 
-            for property in properties:
+            for property, dataset in group.items():
                 # validate properties name
                 assert property in ["n_configs", "energy", "geometry"]
 
-                if "u" in hf[name][property].attrs:
-                    u = hf[name][property].attrs["u"]
-                    temp_record[property] = hf[name][property][
-                        ()
-                    ] * unit.parse_expression(u)
+                if "u" in dataset.attrs:
+                    u = dataset.attrs["u"]
+                    temp_record[property] = dataset[()] * _parse_expression(u)
                 else:
-                    temp_record[property] = hf[name][property][()]
+                    temp_record[property] = dataset[()]
 
             records.append(temp_record)
 
@@ -138,7 +177,8 @@ def test_dict_to_hdf5(prep_temp_dir):
         list_files("/path/that/should/not/exist/", ".hdf5")
 
 
-def test_series_dict_to_hdf5(prep_temp_dir):
+@pytest.mark.parametrize("compression", [None, "gzip", "lzf"])
+def test_series_dict_to_hdf5(prep_temp_dir, compression):
     # generate an hdf5 file from simple test data
     # then read it in and see that we can reconstruct the same data
     # here this will test defining if an attribute is part of a series
@@ -161,12 +201,13 @@ def test_series_dict_to_hdf5(prep_temp_dir):
             * unit.angstrom,
         },
     ]
-    file_name_path = file_path + "/test_series.hdf5"
+    file_name_path = file_path + f"/test_series_{compression}.hdf5"
     dict_to_hdf5(
         file_name=file_name_path,
         data=test_data,
         series_info=record_entries_series,
         id_key="name",
+        compression=compression,
     )
 
     # check we wrote the file
@@ -175,37 +216,41 @@ def test_series_dict_to_hdf5(prep_temp_dir):
     # read in the hdf5 file
     records = []
     with h5py.File(file_name_path, "r") as hf:
-        test_names = list(hf.keys())
-
         # validate names
-        assert test_names == ["test1"]
+        assert list(hf) == ["test1"]
 
-        for name in test_names:
+        for name, group in hf.items():
             temp_record = {}
             temp_record["name"] = name
-            properties = list(hf[name].keys())
 
-            for property in properties:
+            for property in group:
                 # validate properties name
                 assert property in ["n_configs", "energy", "geometry"]
 
-            n_configs = hf[name]["n_configs"][()]
+            n_configs = group["n_configs"][()]
             temp_record["n_configs"] = n_configs
 
             for property in ["energy", "geometry"]:
-                format = hf[name][property].attrs["format"]
+                dataset = group[property]
+                # only series are compressed
+                assert dataset.compression == compression
+                # compressed series are stored as one chunk per record
+                if compression is not None:
+                    assert dataset.chunks == dataset.shape
+                format = dataset.attrs["format"]
                 if format.split("_")[0] == "series":
-                    temp = []
-                    for i in range(n_configs):
-                        temp.append(hf[name][property][i])
-
-                    if "u" in hf[name][property].attrs:
-                        u = hf[name][property].attrs["u"]
-                        temp_record[property] = np.array(temp) * unit.parse_expression(
-                            u
-                        )
+                    # read all conformers with a single selection into a
+                    # preallocated buffer
+                    temp = np.empty(
+                        (n_configs,) + dataset.shape[1:], dtype=dataset.dtype
+                    )
+                    dataset.read_direct(temp, source_sel=np.s_[0:n_configs])
+
+                    if "u" in dataset.attrs:
+                        u = dataset.attrs["u"]
+                        temp_record[property] = temp * _parse_expression(u)
                     else:
-                        temp_record[property] = np.array(temp)
+                        temp_record[property] = temp
 
             records.append(temp_record)
 
@@ -225,6 +270,94 @@ def test_series_dict_to_hdf5(prep_temp_dir):
                 assert records[i][key] == test_data[i][key]
 
 
+def test_dict_to_hdf5_libver(prep_temp_dir):
+    data = [{"name": "test1", "energy": np.array([[1.0], [2.0]]) * unit.hartree}]
+    series_info = {"name": "single_rec", "energy": "series_mol"}
+    default_file = str(prep_temp_dir) + "/test_libver_default.hdf5"
+    latest_file = str(prep_temp_dir) + "/test_libver_latest.hdf5"
+    dict_to_hdf5(default_file, data, series_info, id_key="name")
+    dict_to_hdf5(latest_file, data, series_info, id_key="name", libver="latest")
+
+    # by default the earliest format is written (superblock version 0), which
+    # HDF5 1.8 readers can open
+    with h5py.File(default_file, "r") as hf:
+        assert hf.id.get_create_plist().get_version()[0] == 0
+        # series datasets are only compressed when asked for
+        assert hf["test1"]["energy"].compression is None
+        assert hf["test1"]["energy"].chunks is None
+
+    # the latest format has to be requested and supports SWMR reads
+    with h5py.File(latest_file, "r", swmr=True) as hf:
+        assert hf.id.get_create_plist().get_version()[0] >= 2
+        assert np.array_equal(hf["test1"]["energy"][()], np.array([[1.0], [2.0]]))
+
+
+def test_series_dict_to_hdf5_storage_dtype(prep_temp_dir):
+    # floating point series are stored in the requested dtype, everything
+    # else keeps its own dtype
+    file_name_path = str(prep_temp_dir) + "/test_series_float16.hdf5"
+    geometry = np.array(
+        [[[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]], [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]]],
+        dtype=np.float32,
+    )
+    dict_to_hdf5(
+        file_name=file_name_path,
+        data=[
+            {
+                "name": "test1",
+                "atomic_numbers": np.array([[1], [6]], dtype=np.int32),
+                "geometry": geometry * unit.angstrom,
+            }
+        ],
+        series_info={
+            "name": "single_rec",
+            "atomic_numbers": "single_atom",
+            "geometry": "series_atom",
+        },
+        id_key="name",
+        storage_dtype="float16",
+    )
+
+    with h5py.File(file_name_path, "r") as hf:
+        assert hf["test1"]["geometry"].dtype == np.float16
+        assert hf["test1"]["atomic_numbers"].dtype == np.int32
+        assert np.array_equal(hf["test1"]["geometry"][()].astype(np.float32), geometry)
+
+    # values that do not fit in the storage dtype are rejected rather than
+    # being written as inf
+    with pytest.raises(ValueError):
+        dict_to_hdf5(
+            file_name=str(prep_temp_dir) + "/test_series_float16_overflow.hdf5",
+            data=[
+                {
+                    "name": "test1",
+                    "forces": np.array([[[1.0e6, 0.0, 0.0]]]) * unit.kilojoule_per_mole,
+                }
+            ],
+            series_info={"name": "single_rec", "forces": "series_atom"},
+            id_key="name",
+            storage_dtype="float16",
+        )
+
+
+def test_curation_storage_dtype(prep_temp_dir, curation_data_dir):
+    # storage_dtype is passed from the curation class to dict_to_hdf5
+    ani1_data = ANI1xCuration(
+        hdf5_file_name="test_dataset_float16.hdf5",
+        output_file_dir=str(prep_temp_dir),
+        local_cache_dir=str(prep_temp_dir),
+        convert_units=False,
+        storage_dtype="float16",
+    )
+    ani1_data._process_downloaded(str(curation_data_dir), "ani1_n5.hdf5", max_records=1)
+    ani1_data._generate_hdf5()
+
+    with h5py.File(str(prep_temp_dir) + "/test_dataset_float16.hdf5", "r") as hf:
+        record = hf[ani1_data.data[0]["name"]]
+        assert record["geometry"].dtype == np.float16
+        assert record["wb97x_dz.energy"].dtype == np.float64
+
+
 def test_str_to_float(prep_temp_dir):
     val = str_to_float("1*^6")
     assert val == 1e6
@@ -232,6 +365,11 @@ def test_str_to_float(prep_temp_dir):
     val = str_to_float("100")
     assert val == 100
 
+    vals = str_to_float_array([["1*^6", "100"], ["-2.5*^-3", "0.1"]])
+    assert vals.dtype == np.float64
+    assert vals.shape == (2, 2)
+    assert np.all(vals == np.array([[1e6, 100.0], [-2.5e-3, 0.1]]))
+
 
 def test_qm9_curation_init_parameters(prep_temp_dir):
     qm9_data = QM9Curation(
@@ -273,13 +411,13 @@ def test_qm9_reference_energy(prep_temp_dir):
         local_cache_dir=str(prep_temp_dir),
         convert_units=True,
     )
-    assert (
-        qm9_data._calculate_reference_thermochemistry(["C", "H", "H", "H", "H"], "U_0K")
-        == -39.847864 * unit.hartree
-    )
+    assert qm9_data._calculate_reference_thermochemistry(
+        ["C", "H", "H", "H", "H"], "U_0K"
+    ).m_as(unit.hartree) == pytest.approx(-39.847864, rel=1e-12)
 
 
-def test_qm9_curation_parse_xyz(prep_temp_dir):
+@pytest.fixture(scope="session")
+def qm9_parsed_properties(prep_temp_dir):
     qm9_data = QM9Curation(
         hdf5_file_name="qm9_dataset.hdf5",
         output_file_dir=str(prep_temp_dir),
@@ -287,30 +425,49 @@ def test_qm9_curation_parse_xyz(prep_temp_dir):
         convert_units=True,
     )
 
-    # check to ensure we can parse the properties line correctly
     # This is data is modified from dsgdb9nsd_000001.xyz, with floats truncated to one decimal place
     temp_line = "gdb 1  157.7  157.7  157.7  0.  13.2  -0.3  0.1  0.5  35.3  0.0  -40.4  -40.4  -40.4  -40.4  6.4"
-    temp_dict = qm9_data._parse_properties(temp_line)
-
-    # units are applied in _parse_properties
-    assert len(temp_dict) == 17
-    assert temp_dict["tag"] == "gdb"
-    assert temp_dict["idx"] == "1"
-    assert temp_dict["rotational_constant_A"] == 157.7
-    assert temp_dict["rotational_constant_B"] == 157.7
-    assert temp_dict["rotational_constant_C"] == 157.7
-    assert temp_dict["dipole_moment"] == 0
-    assert temp_dict["isotropic_polarizability"] == 13.2
-    assert temp_dict["energy_of_homo"] == -0.3
-    assert temp_dict["energy_of_lumo"] == 0.1
-    assert temp_dict["lumo-homo_gap"] == 0.5
-    assert temp_dict["electronic_spatial_extent"] == 35.3
-    assert temp_dict["zero_point_vibrational_energy"] == 0.0
-    assert temp_dict["internal_energy_at_0K"] == -40.4
-    assert temp_dict["internal_energy_at_298.15K"] == -40.4
-    assert temp_dict["enthalpy_at_298.15K"] == -40.4
-    assert temp_dict["free_energy_at_298.15K"] == -40.4
-    assert temp_dict["heat_capacity_at_298.15K"] == 6.4
+    return qm9_data._parse_properties(temp_line)
+
+
+def test_qm9_curation_parse_properties_length(qm9_parsed_properties):
+    assert len(qm9_parsed_properties) == 17
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("tag", "gdb"),
+        ("idx", "1"),
+        ("rotational_constant_A", 157.7),
+        ("rotational_constant_B", 157.7),
+        ("rotational_constant_C", 157.7),
+        ("dipole_moment", 0),
+        ("isotropic_polarizability", 13.2),
+        ("energy_of_homo", -0.3),
+        ("energy_of_lumo", 0.1),
+        ("lumo-homo_gap", 0.5),
+        ("electronic_spatial_extent", 35.3),
+        ("zero_point_vibrational_energy", 0.0),
+        ("internal_energy_at_0K", -40.4),
+        ("internal_energy_at_298.15K", -40.4),
+        ("enthalpy_at_298.15K", -40.4),
+        ("free_energy_at_298.15K", -40.4),
+        ("heat_capacity_at_298.15K", 6.4),
+    ],
+)
+def test_qm9_curation_parse_properties(qm9_parsed_properties, key, expected):
+    # check to ensure we can parse the properties line correctly
+    assert qm9_parsed_properties[key] == expected
+
+
+def test_qm9_curation_parse_xyz(prep_temp_dir):
+    qm9_data = QM9Curation(
+        hdf5_file_name="qm9_dataset.hdf5",
+        output_file_dir=str(prep_temp_dir),
+        local_cache_dir=str(prep_temp_dir),
+        convert_units=True,
+    )
 
     # test parsing an entire file from our data directory with unit conversions
     fn = resources.files("modelforge").joinpath("tests", "data", "dsgdb9nsd_000001.xyz")
@@ -319,22 +476,20 @@ def test_qm9_curation_parse_xyz(prep_temp_dir):
     # spot check values
     # geometry is a per atom property so will be of shape [m,n,3]
     # where for qm9, the number of conformers, m = 1
-    assert np.all(
-        np.isclose(
-            data_dict_temp["geometry"],
-            np.array(
+    assert_quantity_allclose(
+        data_dict_temp["geometry"],
+        np.array(
+            [
                 [
-                    [
-                        [-1.26981359e-03, 1.08580416e-01, 8.00099580e-04],
-                        [2.15041600e-04, -6.03131760e-04, 1.97612040e-04],
-                        [1.01173084e-01, 1.46375116e-01, 2.76574800e-05],
-                        [-5.40815069e-02, 1.44752661e-01, -8.76643715e-02],
-                        [-5.23813634e-02, 1.43793264e-01, 9.06397294e-02],
-                    ]
+                    [-1.26981359e-03, 1.08580416e-01, 8.00099580e-04],
+                    [2.15041600e-04, -6.03131760e-04, 1.97612040e-04],
+                    [1.01173084e-01, 1.46375116e-01, 2.76574800e-05],
+                    [-5.40815069e-02, 1.44752661e-01, -8.76643715e-02],
+                    [-5.23813634e-02, 1.43793264e-01, 9.06397294e-02],
                 ]
-            )
-            * unit.nanometer,
-        )
+            ]
+        ),
+        unit.nanometer,
     )
     # [m, n, 1] shape
     assert np.all(
@@ -342,22 +497,27 @@ def test_qm9_curation_parse_xyz(prep_temp_dir):
         == np.array([[[-0.535689], [0.133921], [0.133922], [0.133923], [0.133923]]])
         * unit.elementary_charge
     )
-    assert data_dict_temp["isotropic_polarizability"] == [[13.21]] * unit.angstroms**3
-    assert data_dict_temp["energy_of_homo"] == [[-0.3877]] * unit.hartree
-    assert data_dict_temp["energy_of_lumo"] == [[0.1171]] * unit.hartree
-    assert data_dict_temp["lumo-homo_gap"] == [[0.5048]] * unit.hartree
-    assert data_dict_temp["electronic_spatial_extent"] == [[35.3641]] * unit.angstrom**2
-    assert (
-        data_dict_temp["zero_point_vibrational_energy"] == [[0.044749]] * unit.hartree
-    )
-    assert data_dict_temp["internal_energy_at_0K"] == [[-40.47893]] * unit.hartree
-    assert data_dict_temp["internal_energy_at_298.15K"] == [[-40.476062]] * unit.hartree
-    assert data_dict_temp["enthalpy_at_298.15K"] == [[-40.475117]] * unit.hartree
-    assert data_dict_temp["free_energy_at_298.15K"] == [[-40.498597]] * unit.hartree
-    assert (
-        data_dict_temp["heat_capacity_at_298.15K"]
-        == [[6.469]] * unit.calorie_per_mole / unit.kelvin
-    )
+    # per molecule scalar properties, shape [m,1]; compare magnitudes in the
+    # expected unit rather than constructing a quantity for every check
+    expected_per_molecule = {
+        "isotropic_polarizability": (13.21, unit.angstrom**3),
+        "energy_of_homo": (-0.3877, unit.hartree),
+        "energy_of_lumo": (0.1171, unit.hartree),
+        "lumo-homo_gap": (0.5048, unit.hartree),
+        "electronic_spatial_extent": (35.3641, unit.angstrom**2),
+        "zero_point_vibrational_energy": (0.044749, unit.hartree),
+        "internal_energy_at_0K": (-40.47893, unit.hartree),
+        "internal_energy_at_298.15K": (-40.476062, unit.hartree),
+        "enthalpy_at_298.15K": (-40.475117, unit.hartree),
+        "free_energy_at_298.15K": (-40.498597, unit.hartree),
+        "heat_capacity_at_298.15K": (6.469, unit.calorie_per_mole / unit.kelvin),
+        "dipole_moment": (0.0, unit.debye),
+    }
+    for key, (expected_value, expected_unit) in expected_per_molecule.items():
+        assert data_dict_temp[key].shape == (1, 1)
+        assert data_dict_temp[key].m_as(expected_unit)[0, 0] == pytest.approx(
+            expected_value, rel=1e-12
+        )
     # atomic_numbers do not change with conformers, so it is defined as [n,1]
     assert np.all(
         data_dict_temp["atomic_numbers"] == np.array([[6], [1], [1], [1], [1]])
@@ -372,7 +532,6 @@ def test_qm9_curation_parse_xyz(prep_temp_dir):
         == np.array([[157.7118, 157.70997, 157.70699]]) * unit.gigahertz
     )
 
-    assert data_dict_temp["dipole_moment"] == [[0.0]] * unit.debye
     assert np.all(
         data_dict_temp["harmonic_vibrational_frequencies"]
         == np.array(
@@ -392,29 +551,34 @@ def test_qm9_curation_parse_xyz(prep_temp_dir):
         )
         / unit.centimeter
     )
-    assert np.allclose(
+    assert_quantity_allclose(
         data_dict_temp["reference_energy_at_0K"],
-        np.array([-39.847864]).reshape(1, 1) * unit.hartree,
+        np.array([-39.847864]).reshape(1, 1),
+        unit.hartree,
     )
-    assert np.allclose(
+    assert_quantity_allclose(
         data_dict_temp["formation_energy_at_0K"],
-        np.array([-0.631066]).reshape(1, 1) * unit.hartree,
+        np.array([-0.631066]).reshape(1, 1),
+        unit.hartree,
     )
-    assert np.allclose(
+    assert_quantity_allclose(
         data_dict_temp["reference_energy_at_298.15K"],
-        np.array([-39.840783]).reshape(1, 1) * unit.hartree,
+        np.array([-39.840783]).reshape(1, 1),
+        unit.hartree,
     )
-    assert np.allclose(
+    assert_quantity_allclose(
         data_dict_temp["reference_enthalpy_at_298.15K"],
-        np.array([-39.836059]).reshape(1, 1) * unit.hartree,
+        np.array([-39.836059]).reshape(1, 1),
+        unit.hartree,
     )
-    assert np.allclose(
+    assert_quantity_allclose(
         data_dict_temp["reference_free_energy_at_298.15K"],
-        np.array([-39.905025]).reshape(1, 1) * unit.hartree,
+        np.array([-39.905025]).reshape(1, 1),
+        unit.hartree,
     )
 
 
-def test_qm9_local_archive(prep_temp_dir):
+def test_qm9_local_archive(prep_temp_dir, curation_data_dir):
     # test file extraction, parsing, and generation of hdf5 file from a local archive.
     qm9_data = QM9Curation(
         hdf5_file_name="qm9_test10.hdf5",
@@ -422,10 +586,7 @@ def test_qm9_local_archive(prep_temp_dir):
         local_cache_dir=str(prep_temp_dir),
     )
 
-    local_data_path = resources.files("modelforge").joinpath("tests", "data")
-    # make sure the data archive exists
-    file_name_path = str(local_data_path) + "/first10.tar.bz2"
-    assert os.path.isfile(file_name_path)
+    local_data_path = curation_data_dir
 
     from modelforge.utils.misc import extract_tarred_file
 
@@ -488,9 +649,79 @@ def test_qm9_local_archive(prep_temp_dir):
     )
     assert qm9_data.total_conformers == 5
     assert len(qm9_data.data) == 5
+    serial_names = [record["name"] for record in qm9_data.data]
+
+    # parsing in parallel yields the same records in the same order
+    qm9_data._clear_data()
+    qm9_data._process_downloaded(str(prep_temp_dir), max_records=5, n_workers=2)
+    assert [record["name"] for record in qm9_data.data] == serial_names
+
+
+def test_qm9_stream_archive(prep_temp_dir, curation_data_dir):
+    # parsing the xyz files directly from the archive has to give the same
+    # records as parsing the extracted files
+    from modelforge.utils.misc import extract_tarred_file
+
+    local_data_path = str(curation_data_dir)
+    extracted_dir = str(prep_temp_dir) + "/qm9_stream_extracted"
+    extract_tarred_file(local_data_path, "first10.tar.bz2", extracted_dir, mode="r:bz2")
 
+    qm9_extracted = QM9Curation(
+        hdf5_file_name="qm9_test10.hdf5",
+        output_file_dir=str(prep_temp_dir),
+        local_cache_dir=str(prep_temp_dir),
+    )
+    qm9_extracted._process_downloaded(extracted_dir)
 
-def test_ani1_process_download_short(prep_temp_dir):
+    qm9_streamed = QM9Curation(
+        hdf5_file_name="qm9_test10.hdf5",
+        output_file_dir=str(prep_temp_dir),
+        local_cache_dir=str(prep_temp_dir),
+    )
+    qm9_streamed._process_downloaded_archive(local_data_path + "/first10.tar.bz2")
+
+    assert qm9_streamed.total_records == 10
+    for streamed, extracted in zip(qm9_streamed.data, qm9_extracted.data):
+        assert streamed["name"] == extracted["name"]
+        assert np.all(streamed["geometry"].m == extracted["geometry"].m)
+        assert np.all(
+            streamed["internal_energy_at_0K"].m == extracted["internal_energy_at_0K"].m
+        )
+
+    qm9_streamed._clear_data()
+    qm9_streamed._process_downloaded_archive(
+        local_data_path + "/first10.tar.bz2", max_records=5
+    )
+    assert qm9_streamed.total_records == 5
+
+    # parsing in a process pool gives the same records in the same order
+    qm9_streamed._clear_data()
+    qm9_streamed._process_downloaded_archive(
+        local_data_path + "/first10.tar.bz2", n_workers=2
+    )
+    assert [record["name"] for record in qm9_streamed.data] == [
+        record["name"] for record in qm9_extracted.data
+    ]
+
+    # a subset holds the first files sorted by name, as for the extracted
+    # directory, even if the archive stores them in a different order
+    import tarfile
+
+    reversed_archive = str(prep_temp_dir) + "/qm9_stream_reversed.tar.bz2"
+    with tarfile.open(reversed_archive, "w:bz2") as tar:
+        for file in sorted(os.listdir(extracted_dir), reverse=True):
+            tar.add(f"{extracted_dir}/{file}", arcname=file)
+
+    qm9_extracted._clear_data()
+    qm9_extracted._process_downloaded(extracted_dir, max_records=5)
+    qm9_streamed._clear_data()
+    qm9_streamed._process_downloaded_archive(reversed_archive, max_records=5)
+    assert [record["name"] for record in qm9_streamed.data] == [
+        record["name"] for record in qm9_extracted.data
+    ]
+
+
+def test_ani1_process_download_short(prep_temp_dir, curation_data_dir):
     # first check where we don't convert units
     ani1_data = ANI1xCuration(
         hdf5_file_name="test_dataset.hdf5",
@@ -499,11 +730,8 @@ def test_ani1_process_download_short(prep_temp_dir):
         convert_units=True,
     )
 
-    local_data_path = resources.files("modelforge").joinpath("tests", "data")
-    # make sure the data archive exists
+    local_data_path = curation_data_dir
     hdf5_file = "ani1_n5.hdf5"
-    file_name_path = str(local_data_path) + "/" + hdf5_file
-    assert os.path.isfile(file_name_path)
 
     ani1_data._process_downloaded(str(local_data_path), hdf5_file)
 
@@ -552,14 +780,38 @@ def test_ani1_process_download_short(prep_temp_dir):
         str(local_data_path), hdf5_file, total_conformers=5, max_conformers_per_record=2
     )
     assert ani1_data.total_conformers == 5
+
+    # records without selected conformers are read as empty arrays
+    ani1_data._clear_data()
+    ani1_data._process_downloaded(
+        str(local_data_path), hdf5_file, max_records=2, max_conformers_per_record=0
+    )
+    assert ani1_data.total_conformers == 0
+    assert ani1_data.data[0]["geometry"].shape[0] == 0
     with pytest.raises(Exception):
         ani1_data.process(max_records=10, total_conformers=5)
 
 
-def test_ani1_process_download_no_conversion(prep_temp_dir):
-    from numpy import array, float32, uint8
-    from openff.units import unit
-
+# reference values for the first record of ani1_n5.hdf5
+_ANI1X_ATOMIC_NUMBERS = _load_reference("ani1x_atomic_numbers")
+_ANI1X_GEOMETRY = _load_reference("ani1x_geometry")
+_ANI1X_WB97X_DZ_FORCES = _load_reference("ani1x_wb97x_dz_forces")
+_ANI1X_WB97X_TZ_FORCES = _load_reference("ani1x_wb97x_tz_forces")
+_ANI1X_WB97X_TZ_DIPOLE = _load_reference("ani1x_wb97x_tz_dipole")
+_ANI1X_WB97X_DZ_CM5_CHARGES = _load_reference("ani1x_wb97x_dz_cm5_charges")
+_ANI1X_WB97X_DZ_HIRSHFELD_CHARGES = _load_reference("ani1x_wb97x_dz_hirshfeld_charges")
+_ANI1X_WB97X_TZ_MBIS_CHARGES = _load_reference("ani1x_wb97x_tz_mbis_charges")
+_ANI1X_WB97X_TZ_MBIS_DIPOLES = _load_reference("ani1x_wb97x_tz_mbis_dipoles")
+_ANI1X_WB97X_TZ_MBIS_QUADRUPOLES = _load_reference("ani1x_wb97x_tz_mbis_quadrupoles")
+_ANI1X_WB97X_TZ_MBIS_OCTUPOLES = _load_reference("ani1x_wb97x_tz_mbis_octupoles")
+_ANI1X_WB97X_TZ_MBIS_VOLUMES = _load_reference("ani1x_wb97x_tz_mbis_volumes")
+_ANI1X_GEOMETRY_CONVERTED = _load_reference("ani1x_geometry_converted")
+_ANI1X_WB97X_DZ_FORCES_CONVERTED = _load_reference("ani1x_wb97x_dz_forces_converted")
+_ANI1X_WB97X_TZ_FORCES_CONVERTED = _load_reference("ani1x_wb97x_tz_forces_converted")
+_ANI1X_WB97X_TZ_DIPOLE_CONVERTED = _load_reference("ani1x_wb97x_tz_dipole_converted")
+
+
+def test_ani1_process_download_no_conversion(prep_temp_dir, curation_data_dir):
     # first check where we don't convert units
     ani1_data = ANI1xCuration(
         hdf5_file_name="test_dataset.hdf5",
@@ -568,305 +820,91 @@ def test_ani1_process_download_no_conversion(prep_temp_dir):
         convert_units=False,
     )
 
-    local_data_path = resources.files("modelforge").joinpath("tests", "data")
-    # make sure the data archive exists
+    local_data_path = curation_data_dir
     hdf5_file = "ani1_n5.hdf5"
-    file_name_path = str(local_data_path) + "/" + hdf5_file
-    assert os.path.isfile(file_name_path)
 
     ani1_data._process_downloaded(str(local_data_path), hdf5_file, max_records=1)
 
     #
 
     assert ani1_data.data[0]["name"] == "C1H4N4O4"
-    assert np.all(
-        ani1_data.data[0]["atomic_numbers"]
-        == array([6, 1, 1, 1, 1, 7, 7, 7, 7, 8, 8, 8, 8], dtype=uint8).reshape(-1, 1)
+    assert np.array_equal(
+        ani1_data.data[0]["atomic_numbers"], _ANI1X_ATOMIC_NUMBERS.reshape(-1, 1)
     )
     assert ani1_data.data[0]["n_configs"] == 2
 
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["geometry"][0],
-            array(
-                [
-                    [1.0234026, 0.82911, 0.10283028],
-                    [-1.300884, 0.38319817, 1.3651426],
-                    [-3.184876, -1.2480949, -0.64869606],
-                    [0.17089044, -0.2244574, 1.6787908],
-                    [2.1853921, 0.6403561, -1.6791393],
-                    [0.7845485, -0.25825635, 0.926529],
-                    [1.346796, -1.388733, 0.46308622],
-                    [1.9548454, -1.1122795, -0.61758876],
-                    [1.7804027, 0.20914805, -0.8599248],
-                    [-1.1696881, -0.22681895, 0.548168],
-                    [-1.9126405, 0.1927124, -0.5437298],
-                    [-3.2172801, -0.28912666, -0.30542406],
-                    [0.6649727, 1.9888812, 0.21126188],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("angstrom"),
-        )
-    )
-    assert ani1_data.data[0]["wb97x_dz.energy"][
-        0
-    ] == -559.9673266512569 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["wb97x_tz.energy"][
-        0
-    ] == -560.215362918279 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["ccsd(t)_cbs.energy"][
-        0
-    ] == -559.6590647156545 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["hf_dz.energy"][
-        0
-    ] == -557.1375898559961 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["hf_tz.energy"][
-        0
-    ] == -557.3013494778872 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["hf_qz.energy"][
-        0
-    ] == -557.3426482230868 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["npno_ccsd(t)_dz.corr_energy"][
-        0
-    ] == -1.6281721046206972 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["npno_ccsd(t)_tz.corr_energy"][
-        0
-    ] == -2.02456426080263 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["tpno_ccsd(t)_dz.corr_energy"][
-        0
-    ] == -1.6309148176133395 * unit.parse_expression("hartree")
-    assert ani1_data.data[0]["mp2_dz.corr_energy"][
-        0
-    ] == -1.5539720835219866 * unit.parse_expression("hartree / angstrom")
-    assert ani1_data.data[0]["mp2_tz.corr_energy"][
-        0
-    ] == -1.9429519127460972 * unit.parse_expression("hartree / angstrom")
-    assert ani1_data.data[0]["mp2_qz.corr_energy"][
-        0
-    ] == -2.0852302230766 * unit.parse_expression("hartree / angstrom")
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_dz.forces"][0],
-            array(
-                [
-                    [0.01657831, 0.00208556, 0.00961986],
-                    [-0.03721527, -0.0103774, -0.08432362],
-                    [0.00524313, 0.06732982, 0.02280491],
-                    [0.00821256, -0.02387543, 0.06603277],
-                    [-0.00206462, -0.00357482, 0.00431916],
-                    [0.20106082, 0.01689906, -0.02965967],
-                    [-0.00325114, 0.00842358, 0.00410941],
-                    [-0.00429628, -0.00360803, 0.00523179],
-                    [0.00421975, 0.00448409, -0.00442295],
-                    [-0.13058083, 0.01246929, 0.01397585],
-                    [-0.04244819, 0.00138314, 0.02921354],
-                    [-0.01240513, -0.05592296, -0.03804544],
-                    [-0.00305312, -0.0157159, 0.00114439],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("hartree / angstrom"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.forces"][0],
-            array(
-                [
-                    [0.01855607, -0.00214226, 0.01092401],
-                    [-0.03279239, -0.0199622, -0.09091964],
-                    [0.00151677, 0.0789296, 0.02715147],
-                    [0.01231755, -0.02255309, 0.05784418],
-                    [-0.00507628, -0.00623896, 0.01045448],
-                    [0.19719525, 0.01809859, -0.02661953],
-                    [0.00315192, 0.02208645, -0.00703623],
-                    [-0.01387949, 0.00197019, 0.01935457],
-                    [0.00491522, 0.0051114, -0.00407311],
-                    [-0.13600205, 0.0243378, 0.01847638],
-                    [-0.0431021, -0.00464446, 0.03555103],
-                    [-0.00483578, -0.06529695, -0.04488963],
-                    [0.00254801, -0.02906634, -0.00092595],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("hartree / angstrom"),
-        )
-    )
-    assert np.all(np.isnan(ani1_data.data[0]["wb97x_dz.dipole"][0].m))
+    # per-atom/per-molecule arrays of the first conformer: property, reference
+    # array and the unit of the reference (None for unitless properties)
+    for key, reference, units in [
+        ("geometry", _ANI1X_GEOMETRY, "angstrom"),
+        ("wb97x_dz.forces", _ANI1X_WB97X_DZ_FORCES, "hartree / angstrom"),
+        ("wb97x_tz.forces", _ANI1X_WB97X_TZ_FORCES, "hartree / angstrom"),
+        ("wb97x_tz.dipole", _ANI1X_WB97X_TZ_DIPOLE, "angstrom * elementary_charge"),
+        (
+            "wb97x_dz.cm5_charges",
+            _ANI1X_WB97X_DZ_CM5_CHARGES.reshape(-1, 1),
+            "elementary_charge",
+        ),
+        (
+            "wb97x_dz.hirshfeld_charges",
+            _ANI1X_WB97X_DZ_HIRSHFELD_CHARGES.reshape(-1, 1),
+            "elementary_charge",
+        ),
+        (
+            "wb97x_tz.mbis_charges",
+            _ANI1X_WB97X_TZ_MBIS_CHARGES.reshape(-1, 1),
+            "elementary_charge",
+        ),
+        ("wb97x_tz.mbis_dipoles", _ANI1X_WB97X_TZ_MBIS_DIPOLES.reshape(-1, 1), None),
+        (
+            "wb97x_tz.mbis_quadrupoles",
+            _ANI1X_WB97X_TZ_MBIS_QUADRUPOLES.reshape(-1, 1),
+            None,
+        ),
+        (
+            "wb97x_tz.mbis_octupoles",
+            _ANI1X_WB97X_TZ_MBIS_OCTUPOLES.reshape(-1, 1),
+            None,
+        ),
+        ("wb97x_tz.mbis_volumes", _ANI1X_WB97X_TZ_MBIS_VOLUMES.reshape(-1, 1), None),
+    ]:
+        assert_quantity_allclose(ani1_data.data[0][key][0], reference, units)
 
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.dipole"][0],
-            array([-0.15512912, -0.2733479, 0.07883724], dtype=float32)
-            * unit.parse_expression("angstrom * elementary_charge"),
-        )
-    )
-    assert np.all(np.isnan(ani1_data.data[0]["wb97x_dz.quadrupole"][0].m))
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_dz.cm5_charges"][0],
-            array(
-                [
-                    0.351663,
-                    0.349011,
-                    0.346528,
-                    0.386354,
-                    0.374394,
-                    -0.32615,
-                    -0.086787,
-                    -0.097374,
-                    -0.292904,
-                    -0.278695,
-                    -0.039002,
-                    -0.312688,
-                    -0.374352,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1)
-            * unit.parse_expression("elementary_charge"),
-        )
+    assert ani1_data.data[0]["wb97x_dz.energy"][0].m_as("hartree") == -559.9673266512569
+    assert ani1_data.data[0]["wb97x_tz.energy"][0].m_as("hartree") == -560.215362918279
+    assert (
+        ani1_data.data[0]["ccsd(t)_cbs.energy"][0].m_as("hartree") == -559.6590647156545
     )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_dz.hirshfeld_charges"][0],
-            array(
-                [
-                    0.171673,
-                    0.180061,
-                    0.18349,
-                    0.137237,
-                    0.169678,
-                    -0.036654,
-                    -0.062321,
-                    -0.074566,
-                    -0.035906,
-                    -0.117717,
-                    -0.010697,
-                    -0.165545,
-                    -0.338735,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1)
-            * unit.parse_expression("elementary_charge"),
-        )
+    assert ani1_data.data[0]["hf_dz.energy"][0].m_as("hartree") == -557.1375898559961
+    assert ani1_data.data[0]["hf_tz.energy"][0].m_as("hartree") == -557.3013494778872
+    assert ani1_data.data[0]["hf_qz.energy"][0].m_as("hartree") == -557.3426482230868
+    assert (
+        ani1_data.data[0]["npno_ccsd(t)_dz.corr_energy"][0].m_as("hartree")
+        == -1.6281721046206972
     )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.mbis_charges"][0],
-            array(
-                [
-                    0.78357184,
-                    0.37897816,
-                    0.41236782,
-                    0.38061607,
-                    0.39502603,
-                    -0.3705582,
-                    -0.07132047,
-                    -0.08506158,
-                    -0.4143781,
-                    -0.37768,
-                    0.04198774,
-                    -0.42587414,
-                    -0.6540033,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1)
-            * unit.parse_expression("elementary_charge"),
-        )
+    assert (
+        ani1_data.data[0]["npno_ccsd(t)_tz.corr_energy"][0].m_as("hartree")
+        == -2.02456426080263
     )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.mbis_dipoles"][0],
-            array(
-                [
-                    0.01980357,
-                    0.03066077,
-                    0.02896599,
-                    0.03629951,
-                    0.0400122,
-                    0.1549512,
-                    0.23462445,
-                    0.23667449,
-                    0.13459457,
-                    0.17466189,
-                    0.19845475,
-                    0.13078435,
-                    0.1239773,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1),
-        )
+    assert (
+        ani1_data.data[0]["tpno_ccsd(t)_dz.corr_energy"][0].m_as("hartree")
+        == -1.6309148176133395
     )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.mbis_quadrupoles"][0],
-            array(
-                [
-                    0.17707957,
-                    0.0253119,
-                    0.02866661,
-                    0.01287407,
-                    0.02173789,
-                    0.08036502,
-                    0.37641832,
-                    0.36518043,
-                    0.10376307,
-                    0.25798967,
-                    0.3756285,
-                    0.38644522,
-                    0.13592605,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1),
-        )
+    assert (
+        ani1_data.data[0]["mp2_dz.corr_energy"][0].m_as("hartree / angstrom")
+        == -1.5539720835219866
     )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.mbis_octupoles"][0],
-            array(
-                [
-                    0.46536684,
-                    0.02301415,
-                    0.0209137,
-                    0.00959256,
-                    0.00437022,
-                    0.86948353,
-                    1.1523615,
-                    1.1775111,
-                    0.9538975,
-                    0.6581496,
-                    0.7705625,
-                    0.8619628,
-                    0.58347076,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1),
-        )
+    assert (
+        ani1_data.data[0]["mp2_tz.corr_energy"][0].m_as("hartree / angstrom")
+        == -1.9429519127460972
     )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.mbis_volumes"][0],
-            array(
-                [
-                    21.487135,
-                    1.94764,
-                    1.6454029,
-                    1.2957854,
-                    1.3529116,
-                    28.231989,
-                    27.362038,
-                    27.493708,
-                    28.782227,
-                    23.989635,
-                    20.909227,
-                    25.17341,
-                    26.948938,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1),
-        )
+    assert (
+        ani1_data.data[0]["mp2_qz.corr_energy"][0].m_as("hartree / angstrom")
+        == -2.0852302230766
     )
+    assert np.all(np.isnan(ani1_data.data[0]["wb97x_dz.dipole"][0].m))
+
+    assert np.all(np.isnan(ani1_data.data[0]["wb97x_dz.quadrupole"][0].m))
 
     # check that the shape of the arrays are what we expect
     assert ani1_data.data[0]["atomic_numbers"].shape == (13, 1)
@@ -897,10 +935,7 @@ def test_ani1_process_download_no_conversion(prep_temp_dir):
     assert ani1_data.data[0]["wb97x_tz.mbis_volumes"].shape == (2, 13, 1)
 
 
-def test_an1_process_download_unit_conversion(prep_temp_dir):
-    from numpy import array, float32, uint8
-    from openff.units import unit
-
+def test_an1_process_download_unit_conversion(prep_temp_dir, curation_data_dir):
     # first check where we don't convert units
     ani1_data = ANI1xCuration(
         hdf5_file_name="test_dataset.hdf5",
@@ -909,214 +944,92 @@ def test_an1_process_download_unit_conversion(prep_temp_dir):
         convert_units=True,
     )
 
-    local_data_path = resources.files("modelforge").joinpath("tests", "data")
-    # make sure the data archive exists
+    local_data_path = curation_data_dir
     hdf5_file = "ani1_n5.hdf5"
-    file_name_path = str(local_data_path) + "/" + hdf5_file
-    assert os.path.isfile(file_name_path)
 
     ani1_data._process_downloaded(str(local_data_path), hdf5_file, max_records=1)
 
     #
 
     assert ani1_data.data[0]["name"] == "C1H4N4O4"
-    assert np.all(
-        ani1_data.data[0]["atomic_numbers"]
-        == array([6, 1, 1, 1, 1, 7, 7, 7, 7, 8, 8, 8, 8], dtype=uint8).reshape(-1, 1)
+    assert np.array_equal(
+        ani1_data.data[0]["atomic_numbers"], _ANI1X_ATOMIC_NUMBERS.reshape(-1, 1)
     )
     assert ani1_data.data[0]["n_configs"] == 2
 
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["geometry"][0],
-            array(
-                [
-                    [0.10234026, 0.08291101, 0.01028303],
-                    [-0.1300884, 0.03831982, 0.13651426],
-                    [-0.3184876, -0.1248095, -0.06486961],
-                    [0.01708904, -0.02244574, 0.16787909],
-                    [0.21853922, 0.06403562, -0.16791393],
-                    [0.07845485, -0.02582563, 0.0926529],
-                    [0.1346796, -0.13887331, 0.04630862],
-                    [0.19548455, -0.11122795, -0.06175888],
-                    [0.17804027, 0.02091481, -0.08599248],
-                    [-0.11696881, -0.0226819, 0.0548168],
-                    [-0.19126405, 0.01927124, -0.05437298],
-                    [-0.32172802, -0.02891267, -0.03054241],
-                    [0.06649727, 0.19888812, 0.02112619],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("nanometer"),
-        )
-    )
-    assert ani1_data.data[0]["wb97x_dz.energy"][
-        0
-    ] == -1470194.0142433804 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["wb97x_tz.energy"][
-        0
-    ] == -1470845.2333730247 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["ccsd(t)_cbs.energy"][
-        0
-    ] == -1469384.6726425907 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["hf_dz.energy"][
-        0
-    ] == -1462764.5413076002 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["hf_tz.energy"][
-        0
-    ] == -1463194.4921358367 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["hf_qz.energy"][
-        0
-    ] == -1463302.9219764692 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["npno_ccsd(t)_dz.corr_energy"][
-        0
-    ] == -4274.765273692818 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["npno_ccsd(t)_tz.corr_energy"][
-        0
-    ] == -5315.49273684113 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["tpno_ccsd(t)_dz.corr_energy"][
-        0
-    ] == -4281.966265666197 * unit.parse_expression("kilojoule_per_mole")
-    assert ani1_data.data[0]["mp2_dz.corr_energy"][
-        0
-    ] == -4079.953145048755 * unit.parse_expression("kilojoule_per_mole / angstrom")
-    assert ani1_data.data[0]["mp2_tz.corr_energy"][
-        0
-    ] == -5101.219546441598 * unit.parse_expression("kilojoule_per_mole / angstrom")
-    assert ani1_data.data[0]["mp2_qz.corr_energy"][
-        0
-    ] == -5474.771198920137 * unit.parse_expression("kilojoule_per_mole / angstrom")
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_dz.forces"][0],
-            array(
-                [
-                    [43.526363, 5.475642, 25.25695],
-                    [-97.708694, -27.245872, -221.39165],
-                    [13.765839, 176.77443, 59.874275],
-                    [21.56208, -62.68494, 173.36903],
-                    [-5.420667, -9.385698, 11.339941],
-                    [527.88513, 44.36848, -77.871445],
-                    [-8.535871, 22.116117, 10.789246],
-                    [-11.279875, -9.472887, 13.736053],
-                    [11.078953, 11.772984, -11.612447],
-                    [-342.83994, 32.73812, 36.693592],
-                    [-111.44771, 3.6314259, 76.70014],
-                    [-32.56966, -146.82571, -99.888306],
-                    [-8.015977, -41.2621, 3.004605],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("kilojoule_per_mole / angstrom"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.forces"][0],
-            array(
-                [
-                    [48.718956, -5.6245003, 28.680979],
-                    [-86.09641, -52.410763, -238.7095],
-                    [3.9822836, 207.22966, 71.28617],
-                    [32.339718, -59.213142, 151.86987],
-                    [-13.327763, -16.38038, 27.448246],
-                    [517.7361, 47.51783, -69.88956],
-                    [8.275371, 57.98798, -18.473612],
-                    [-36.4406, 5.172723, 50.815422],
-                    [12.904908, 13.419983, -10.693946],
-                    [-357.07333, 63.8989, 48.509743],
-                    [-113.16454, -12.194016, 93.33922],
-                    [-12.696348, -171.43712, -117.85771],
-                    [6.689795, -76.31368, -2.4310894],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("kilojoule_per_mole / angstrom"),
-        )
-    )
-    assert ani1_data.data[0]["wb97x_dz.dipole"][0].u == unit.parse_expression("debye")
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.dipole"][0],
-            array([-0.7451169, -1.312946, 0.37867138], dtype=float32)
-            * unit.parse_expression("debye"),
-        )
-    )
-    assert ani1_data.data[0]["wb97x_dz.quadrupole"][0].u == unit.parse_expression(
-        "kilojoule_per_mole / angstrom ** 2"
-    )
-
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_dz.cm5_charges"][0],
-            array(
-                [
-                    0.351663,
-                    0.349011,
-                    0.346528,
-                    0.386354,
-                    0.374394,
-                    -0.32615,
-                    -0.086787,
-                    -0.097374,
-                    -0.292904,
-                    -0.278695,
-                    -0.039002,
-                    -0.312688,
-                    -0.374352,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1)
-            * unit.parse_expression("elementary_charge"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_dz.hirshfeld_charges"][0],
-            array(
-                [
-                    0.171673,
-                    0.180061,
-                    0.18349,
-                    0.137237,
-                    0.169678,
-                    -0.036654,
-                    -0.062321,
-                    -0.074566,
-                    -0.035906,
-                    -0.117717,
-                    -0.010697,
-                    -0.165545,
-                    -0.338735,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1)
-            * unit.parse_expression("elementary_charge"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            ani1_data.data[0]["wb97x_tz.mbis_charges"][0],
-            array(
-                [
-                    0.78357184,
-                    0.37897816,
-                    0.41236782,
-                    0.38061607,
-                    0.39502603,
-                    -0.3705582,
-                    -0.07132047,
-                    -0.08506158,
-                    -0.4143781,
-                    -0.37768,
-                    0.04198774,
-                    -0.42587414,
-                    -0.6540033,
-                ],
-                dtype=float32,
-            ).reshape(-1, 1)
-            * unit.parse_expression("elementary_charge"),
-        )
+    # per-atom/per-molecule arrays of the first conformer: property, reference
+    # array and the unit of the reference (None for unitless properties)
+    for key, reference, units in [
+        ("geometry", _ANI1X_GEOMETRY_CONVERTED, "nanometer"),
+        (
+            "wb97x_dz.forces",
+            _ANI1X_WB97X_DZ_FORCES_CONVERTED,
+            "kilojoule_per_mole / angstrom",
+        ),
+        (
+            "wb97x_tz.forces",
+            _ANI1X_WB97X_TZ_FORCES_CONVERTED,
+            "kilojoule_per_mole / angstrom",
+        ),
+        ("wb97x_tz.dipole", _ANI1X_WB97X_TZ_DIPOLE_CONVERTED, "debye"),
+        (
+            "wb97x_dz.cm5_charges",
+            _ANI1X_WB97X_DZ_CM5_CHARGES.reshape(-1, 1),
+            "elementary_charge",
+        ),
+        (
+            "wb97x_dz.hirshfeld_charges",
+            _ANI1X_WB97X_DZ_HIRSHFELD_CHARGES.reshape(-1, 1),
+            "elementary_charge",
+        ),
+        (
+            "wb97x_tz.mbis_charges",
+            _ANI1X_WB97X_TZ_MBIS_CHARGES.reshape(-1, 1),
+            "elementary_charge",
+        ),
+    ]:
+        assert_quantity_allclose(ani1_data.data[0][key][0], reference, units)
+
+    assert ani1_data.data[0]["wb97x_dz.energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-1470194.0142433804, rel=1e-12)
+    assert ani1_data.data[0]["wb97x_tz.energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-1470845.2333730247, rel=1e-12)
+    assert ani1_data.data[0]["ccsd(t)_cbs.energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-1469384.6726425907, rel=1e-12)
+    assert ani1_data.data[0]["hf_dz.energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-1462764.5413076002, rel=1e-12)
+    assert ani1_data.data[0]["hf_tz.energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-1463194.4921358367, rel=1e-12)
+    assert ani1_data.data[0]["hf_qz.energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-1463302.9219764692, rel=1e-12)
+    assert ani1_data.data[0]["npno_ccsd(t)_dz.corr_energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-4274.765273692818, rel=1e-12)
+    assert ani1_data.data[0]["npno_ccsd(t)_tz.corr_energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-5315.49273684113, rel=1e-12)
+    assert ani1_data.data[0]["tpno_ccsd(t)_dz.corr_energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-4281.966265666197, rel=1e-12)
+    assert ani1_data.data[0]["mp2_dz.corr_energy"][0].m_as(
+        "kilojoule_per_mole / angstrom"
+    ) == pytest.approx(-4079.953145048755, rel=1e-12)
+    assert ani1_data.data[0]["mp2_tz.corr_energy"][0].m_as(
+        "kilojoule_per_mole / angstrom"
+    ) == pytest.approx(-5101.219546441598, rel=1e-12)
+    assert ani1_data.data[0]["mp2_qz.corr_energy"][0].m_as(
+        "kilojoule_per_mole / angstrom"
+    ) == pytest.approx(-5474.771198920137, rel=1e-12)
+    assert ani1_data.data[0]["wb97x_dz.dipole"][0].u == unit.debye
+    assert (
+        ani1_data.data[0]["wb97x_dz.quadrupole"][0].u
+        == unit.kilojoule_per_mole / unit.angstrom**2
     )
 
 
@@ -1179,7 +1092,7 @@ def spice1_process_download_short(prep_temp_dir):
     assert spice_data.data[0]["wiberg_lowdin_indices"].shape == (50, 27, 27)
 
 
-def test_baseclass_unit_conversion(prep_temp_dir):
+def test_baseclass_unit_conversion(prep_temp_dir, curation_data_dir):
     spice_data = SPICE1Curation(
         hdf5_file_name="test_dataset.hdf5",
         output_file_dir=str(prep_temp_dir),
@@ -1187,25 +1100,21 @@ def test_baseclass_unit_conversion(prep_temp_dir):
         convert_units=False,
     )
 
-    local_data_path = resources.files("modelforge").joinpath("tests", "data")
-    # make sure the data archive exists
+    local_data_path = curation_data_dir
     hdf5_file = "SPICE-1.1.4_n2.hdf5"
-    file_name_path = str(local_data_path) + "/" + hdf5_file
-    assert os.path.isfile(file_name_path)
 
     spice_data._process_downloaded(str(local_data_path), hdf5_file)
 
     assert spice_data.data[0]["geometry"].u == unit.bohr
-    assert (
-        spice_data.data[0]["dft_total_energy"][0] == -370.43397424571714 * unit.hartree
-    )
+    assert spice_data.data[0]["dft_total_energy"][0].m_as(
+        unit.hartree
+    ) == pytest.approx(-370.43397424571714, rel=1e-12)
 
     spice_data._convert_units()
     assert spice_data.data[0]["geometry"].u == unit.nanometer
-    assert (
-        spice_data.data[0]["dft_total_energy"][0]
-        == -972574.265833225 * unit.kilojoule_per_mole
-    )
+    assert spice_data.data[0]["dft_total_energy"][0].m_as(
+        unit.kilojoule_per_mole
+    ) == pytest.approx(-972574.265833225, rel=1e-12)
     spice_data.qm_parameters["geometry"] = {"u_in": unit.bohr, "u_out": unit.hartree}
 
     with pytest.raises(Exception):
@@ -1219,10 +1128,41 @@ def test_baseclass_unit_conversion(prep_temp_dir):
         spice_data._process_downloaded(str(local_data_path), hdf5_file)
 
 
-def test_spice1_process_download_no_conversion(prep_temp_dir):
-    from numpy import array, float32, uint8
-    from openff.units import unit
-
+def test_spice1_fixture_layout(curation_data_dir):
+    # SPICE1Curation reads the leading conformers of each dataset with a single
+    # read_direct call; contiguous storage serves that as one byte range,
+    # whereas per-conformer chunks would add a chunk lookup per conformer.
+    # The file is small, so it is also stored without filters to avoid
+    # decompressing it on every test run.
+    with h5py.File(str(curation_data_dir) + "/SPICE-1.1.4_n2.hdf5", "r") as hf:
+        for name in hf.keys():
+            for key, dataset in hf[name].items():
+                assert dataset.chunks is None, f"{name}/{key} is chunked"
+                assert dataset.id.get_create_plist().get_nfilters() == 0
+
+
+# reference values for the first record of SPICE-1.1.4_n2.hdf5
+_SPICE1_ATOMIC_NUMBERS = _load_reference("spice1_atomic_numbers")
+_SPICE1_GEOMETRY = _load_reference("spice1_geometry")
+_SPICE1_DFT_TOTAL_GRADIENT = _load_reference("spice1_dft_total_gradient")
+_SPICE1_MBIS_CHARGES = _load_reference("spice1_mbis_charges")
+_SPICE1_MBIS_DIPOLES = _load_reference("spice1_mbis_dipoles")
+_SPICE1_MBIS_QUADRUPOLES = _load_reference("spice1_mbis_quadrupoles")
+_SPICE1_MBIS_OCTUPOLES = _load_reference("spice1_mbis_octupoles")
+_SPICE1_SCF_QUADRUPOLE = _load_reference("spice1_scf_quadrupole")
+_SPICE1_GEOMETRY_CONVERTED = _load_reference("spice1_geometry_converted")
+_SPICE1_DFT_TOTAL_GRADIENT_CONVERTED = _load_reference(
+    "spice1_dft_total_gradient_converted"
+)
+_SPICE1_MBIS_DIPOLES_CONVERTED = _load_reference("spice1_mbis_dipoles_converted")
+_SPICE1_MBIS_QUADRUPOLES_CONVERTED = _load_reference(
+    "spice1_mbis_quadrupoles_converted"
+)
+_SPICE1_MBIS_OCTUPOLES_CONVERTED = _load_reference("spice1_mbis_octupoles_converted")
+_SPICE1_SCF_QUADRUPOLE_CONVERTED = _load_reference("spice1_scf_quadrupole_converted")
+
+
+def test_spice1_process_download_no_conversion(prep_temp_dir, curation_data_dir):
     # first check where we don't convert units
     spice_data = SPICE1Curation(
         hdf5_file_name="test_dataset.hdf5",
@@ -1231,147 +1171,62 @@ def test_spice1_process_download_no_conversion(prep_temp_dir):
         convert_units=False,
     )
 
-    local_data_path = resources.files("modelforge").joinpath("tests", "data")
-    # make sure the data archive exists
+    local_data_path = curation_data_dir
     hdf5_file = "SPICE-1.1.4_n2.hdf5"
-    file_name_path = str(local_data_path) + "/" + hdf5_file
-    assert os.path.isfile(file_name_path)
-
     spice_data._process_downloaded(str(local_data_path), hdf5_file, max_records=1)
 
-    #
-
     assert spice_data.data[0]["name"] == "103147721"
-    assert np.all(
-        spice_data.data[0]["atomic_numbers"]
-        == array(
-            [
-                6,
-                6,
-                6,
-                6,
-                6,
-                6,
-                6,
-                6,
-                7,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-            ],
-        ).reshape(-1, 1)
+    assert np.array_equal(
+        spice_data.data[0]["atomic_numbers"], _SPICE1_ATOMIC_NUMBERS.reshape(-1, 1)
     )
     assert spice_data.data[0]["n_configs"] == 50
 
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["geometry"][0][0],
-            array([1.3423489, 4.156236, -3.2724566], dtype=float32)
-            * unit.parse_expression("bohr"),
-        )
+    assert_quantity_allclose(
+        spice_data.data[0]["geometry"][0][0], _SPICE1_GEOMETRY, "bohr"
     )
-    assert spice_data.data[0]["formation_energy"][
-        0
-    ] == -4.271002275159901 * unit.parse_expression("hartree")
-    assert spice_data.data[0]["dft_total_energy"][
-        0
-    ] == -370.43397424571714 * unit.parse_expression("hartree")
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["dft_total_gradient"][0][0],
-            array([-0.00179922, 0.03140596, -0.01925333], dtype=float32)
-            * unit.parse_expression("hartree / bohr"),
-        )
+    assert (
+        spice_data.data[0]["formation_energy"][0].m_as("hartree") == -4.271002275159901
     )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["mbis_charges"][0][0],
-            array([-0.22982304], dtype=float32)
-            * unit.parse_expression("elementary_charge"),
-        )
+    assert (
+        spice_data.data[0]["dft_total_energy"][0].m_as("hartree") == -370.43397424571714
     )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["mbis_dipoles"][0][0],
-            array([0.00291166, -0.03312059, 0.06175293], dtype=float32)
-            * unit.parse_expression("bohr * elementary_charge"),
-        )
+    assert_quantity_allclose(
+        spice_data.data[0]["dft_total_gradient"][0][0],
+        _SPICE1_DFT_TOTAL_GRADIENT,
+        "hartree / bohr",
     )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["mbis_quadrupoles"][0][0],
-            array(
-                [
-                    [-4.712843, 0.02795503, -0.01111934],
-                    [0.02795503, -4.703707, -0.02350861],
-                    [-0.01111934, -0.02350861, -4.731845],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("bohr ** 2 * elementary_charge"),
-        )
+    assert_quantity_allclose(
+        spice_data.data[0]["mbis_charges"][0][0],
+        _SPICE1_MBIS_CHARGES,
+        "elementary_charge",
     )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["mbis_octupoles"][0][0],
-            array(
-                [
-                    [
-                        [-0.00367656, 0.1068773, 0.05573696],
-                        [0.1068773, -0.19440877, 0.16380504],
-                        [0.05573696, 0.16380504, 0.21165511],
-                    ],
-                    [
-                        [0.1068773, -0.19440877, 0.16380504],
-                        [-0.19440877, -0.03464365, 0.08447122],
-                        [0.16380504, 0.08447122, -0.1936863],
-                    ],
-                    [
-                        [0.05573696, 0.16380504, 0.21165511],
-                        [0.16380504, 0.08447122, -0.1936863],
-                        [0.21165511, -0.1936863, 0.10259467],
-                    ],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("bohr ** 3 * elementary_charge"),
-        )
+    assert_quantity_allclose(
+        spice_data.data[0]["mbis_dipoles"][0][0],
+        _SPICE1_MBIS_DIPOLES,
+        "bohr * elementary_charge",
     )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["scf_dipole"][0][0],
-            1.4204609 * unit.parse_expression("bohr * elementary_charge"),
-        )
+    assert_quantity_allclose(
+        spice_data.data[0]["mbis_quadrupoles"][0][0],
+        _SPICE1_MBIS_QUADRUPOLES,
+        "bohr ** 2 * elementary_charge",
     )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["scf_quadrupole"][0][0],
-            array([-37.290867, -4.6239295, 3.8637419], dtype=float32)
-            * unit.parse_expression("bohr ** 2 * elementary_charge"),
-        )
+    assert_quantity_allclose(
+        spice_data.data[0]["mbis_octupoles"][0][0],
+        _SPICE1_MBIS_OCTUPOLES,
+        "bohr ** 3 * elementary_charge",
+    )
+    assert_quantity_allclose(
+        spice_data.data[0]["scf_dipole"][0][0], 1.4204609, "bohr * elementary_charge"
+    )
+    assert_quantity_allclose(
+        spice_data.data[0]["scf_quadrupole"][0][0],
+        _SPICE1_SCF_QUADRUPOLE,
+        "bohr ** 2 * elementary_charge",
     )
 
 
-def test_spice1_process_download_conversion(prep_temp_dir):
-    from numpy import array, float32, uint8
-    from openff.units import unit
-
-    # first check where we don't convert units
+def test_spice1_process_download_conversion(prep_temp_dir, curation_data_dir):
+    # now check where we convert units
     spice_data = SPICE1Curation(
         hdf5_file_name="test_dataset.hdf5",
         output_file_dir=str(prep_temp_dir),
@@ -1385,140 +1240,61 @@ def test_spice1_process_download_conversion(prep_temp_dir):
     charge = spice_data._calculate_reference_charge("[Na+]")
     assert charge == 1.0 * unit.elementary_charge
 
-    local_data_path = resources.files("modelforge").joinpath("tests", "data")
-    # make sure the data archive exists
+    local_data_path = curation_data_dir
     hdf5_file = "SPICE-1.1.4_n2.hdf5"
-    file_name_path = str(local_data_path) + "/" + hdf5_file
-    assert os.path.isfile(file_name_path)
-
     spice_data._process_downloaded(str(local_data_path), hdf5_file, max_records=1)
 
-    #
-
     assert spice_data.data[0]["name"] == "103147721"
-    assert np.all(
-        spice_data.data[0]["atomic_numbers"]
-        == array(
-            [
-                6,
-                6,
-                6,
-                6,
-                6,
-                6,
-                6,
-                6,
-                7,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-                1,
-            ],
-        ).reshape(-1, 1)
+    assert np.array_equal(
+        spice_data.data[0]["atomic_numbers"], _SPICE1_ATOMIC_NUMBERS.reshape(-1, 1)
     )
     assert spice_data.data[0]["n_configs"] == 50
 
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["geometry"][0][0],
-            array([0.07103405, 0.21993855, -0.17317095], dtype=float32)
-            * unit.parse_expression("nanometer"),
-        )
-    )
-    assert spice_data.data[0]["formation_energy"][
-        0
-    ] == -11213.514933650016 * unit.parse_expression("kilojoule_per_mole")
-    assert spice_data.data[0]["dft_total_energy"][
-        0
-    ] == -972574.265833225 * unit.parse_expression("kilojoule_per_mole")
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["dft_total_gradient"][0][0],
-            array([-8.926773, 155.8199, -95.524925], dtype=float32)
-            * unit.parse_expression("kilojoule_per_mole / angstrom"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["mbis_charges"][0][0],
-            array([-0.22982304], dtype=float32)
-            * unit.parse_expression("elementary_charge"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["mbis_dipoles"][0][0],
-            array([0.00015408, -0.00175267, 0.00326782], dtype=float32)
-            * unit.parse_expression("elementary_charge * nanometer"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["mbis_quadrupoles"][0][0],
-            array(
-                [
-                    [-1.3197304e-02, 7.8282050e-05, -3.1137311e-05],
-                    [7.8282050e-05, -1.3171721e-02, -6.5830805e-05],
-                    [-3.1137311e-05, -6.5830805e-05, -1.3250515e-02],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("elementary_charge * nanometer ** 2"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["mbis_octupoles"][0][0],
-            array(
-                [
-                    [
-                        [-5.44809382e-07, 1.58375824e-05, 8.25936604e-06],
-                        [1.58375824e-05, -2.88084084e-05, 2.42734022e-05],
-                        [8.25936604e-06, 2.42734022e-05, 3.13640521e-05],
-                    ],
-                    [
-                        [1.58375824e-05, -2.88084084e-05, 2.42734022e-05],
-                        [-2.88084084e-05, -5.13365876e-06, 1.25173437e-05],
-                        [2.42734022e-05, 1.25173437e-05, -2.87013499e-05],
-                    ],
-                    [
-                        [8.25936604e-06, 2.42734022e-05, 3.13640521e-05],
-                        [2.42734022e-05, 1.25173437e-05, -2.87013499e-05],
-                        [3.13640521e-05, -2.87013499e-05, 1.52029625e-05],
-                    ],
-                ],
-                dtype=float32,
-            )
-            * unit.parse_expression("elementary_charge * nanometer ** 3"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["scf_dipole"][0][0],
-            0.07516756 * unit.parse_expression("elementary_charge * nanometer"),
-        )
-    )
-    assert np.all(
-        np.isclose(
-            spice_data.data[0]["scf_quadrupole"][0][0],
-            array([-0.10442506, -0.01294832, 0.01081958], dtype=float32)
-            * unit.parse_expression("elementary_charge * nanometer ** 2"),
-        )
+    assert_quantity_allclose(
+        spice_data.data[0]["geometry"][0][0], _SPICE1_GEOMETRY_CONVERTED, "nanometer"
+    )
+    assert spice_data.data[0]["formation_energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-11213.514933650016, rel=1e-12)
+    assert spice_data.data[0]["dft_total_energy"][0].m_as(
+        "kilojoule_per_mole"
+    ) == pytest.approx(-972574.265833225, rel=1e-12)
+    assert_quantity_allclose(
+        spice_data.data[0]["dft_total_gradient"][0][0],
+        _SPICE1_DFT_TOTAL_GRADIENT_CONVERTED,
+        "kilojoule_per_mole / angstrom",
+    )
+    assert_quantity_allclose(
+        spice_data.data[0]["mbis_charges"][0][0],
+        _SPICE1_MBIS_CHARGES,
+        "elementary_charge",
+    )
+    assert_quantity_allclose(
+        spice_data.data[0]["mbis_dipoles"][0][0],
+        _SPICE1_MBIS_DIPOLES_CONVERTED,
+        "elementary_charge * nanometer",
+    )
+    assert_quantity_allclose(
+        spice_data.data[0]["mbis_quadrupoles"][0][0],
+        _SPICE1_MBIS_QUADRUPOLES_CONVERTED,
+        "elementary_charge * nanometer ** 2",
+    )
+    assert_quantity_allclose(
+        spice_data.data[0]["mbis_octupoles"][0][0],
+        _SPICE1_MBIS_OCTUPOLES_CONVERTED,
+        "elementary_charge * nanometer ** 3",
+    )
+    assert_quantity_allclose(
+        spice_data.data[0]["scf_dipole"][0][0],
+        0.07516756,
+        "elementary_charge * nanometer",
+    )
+    assert_quantity_allclose(
+        spice_data.data[0]["scf_quadrupole"][0][0],
+        _SPICE1_SCF_QUADRUPOLE_CONVERTED,
+        "elementary_charge * nanometer ** 2",
     )
+
     spice_data._clear_data()
     spice_data._process_downloaded(
         str(local_data_path), hdf5_file, max_records=1, max_conformers_per_record=1
@@ -1549,11 +1325,11 @@ def test_spice1_process_download_conversion(prep_temp_dir):
         spice_data.process(max_records=2, total_conformers=1)
 
 
-def test_ani2x(prep_temp_dir):
+def test_ani2x(prep_temp_dir, curation_data_dir):
     from modelforge.curation.ani2x_curation import ANI2xCuration
 
     local_path_dir = str(prep_temp_dir)
-    local_data_path = resources.files("modelforge").joinpath("tests", "data")
+    local_data_path = curation_data_dir
 
     # create an hdf5 file that only contains the dimer data, generated using the following script
     # so we can test the _process_downloaded function
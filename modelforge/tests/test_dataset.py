@@ -6,7 +6,12 @@ import numpy as np
 import pytest
 import torch
 
-from modelforge.dataset.dataset import DatasetFactory, TorchDataset, BatchData
+from modelforge.dataset.dataset import (
+    DatasetFactory,
+    TorchDataset,
+    BatchData,
+    initialize_dataset,
+)
 from modelforge.dataset import _ImplementedDatasets
 
 from modelforge.utils.prop import PropertyNames
@@ -18,6 +23,31 @@ def prep_temp_dir(tmp_path_factory):
     return fn
 
 
+@pytest.fixture(scope="session")
+def built_dataset_dir(prep_temp_dir):
+    return str(prep_temp_dir) + "/built_datasets"
+
+
+@pytest.fixture(scope="session")
+def built_dataset(built_dataset_dir):
+    """
+    Build each dataset (download, unzip and process) at most once per session.
+
+    Tests that only read the dataset share the returned TorchDataset; tests that
+    remove cache files use their own local_cache_dir and dataset_factory.
+    """
+    cache = {}
+
+    def _get(dataset_name: str) -> TorchDataset:
+        if dataset_name not in cache:
+            cache[dataset_name] = initialize_dataset(
+                dataset_name=dataset_name, local_cache_dir=built_dataset_dir
+            )
+        return cache[dataset_name]
+
+    return _get
+
+
 def test_dataset_imported():
     """Sample test, will always pass so long as import statement worked."""
 
@@ -55,44 +85,33 @@ def test_dataset_basic_operations():
     assert len(dataset) == total_confs
     assert dataset.record_len() == total_records
 
-    atomic_numbers_true = []
-    geom_true = []
-    energy_true = []
-    series_mol_idxs = []
-    atom_start_idx_series = 0
-    atom_start_idx_single = 0
-    conf_idx = 0
-    for rec in range(total_records):
-        series_mol_idxs_for_rec = []
-        atom_end_idx_single = atom_start_idx_single + atomic_subsystem_counts[rec]
-        for conf in range(n_confs[rec]):
-            atom_end_idx_series = atom_start_idx_series + atomic_subsystem_counts[rec]
-            energy_true.append(input_data["internal_energy_at_0K"][conf_idx])
-            geom_true.append(
-                input_data["geometry"][atom_start_idx_series:atom_end_idx_series]
-            )
-            atomic_numbers_true.append(
-                input_data["atomic_numbers"][
-                    atom_start_idx_single:atom_end_idx_single
-                ].flatten()
-            )
-            series_mol_idxs_for_rec.append(conf_idx)
-            atom_start_idx_series = atom_end_idx_series
-            conf_idx += 1
-        atom_start_idx_single = atom_end_idx_single
-        series_mol_idxs.append(series_mol_idxs_for_rec)
-
-    for conf_idx in range(len(dataset)):
-        conf_data = dataset[conf_idx]
-        pos1 = geom_true[conf_idx]
-        pos2 = conf_data.nnp_input.positions
-        assert np.array_equal(pos2, pos1)
-        assert np.array_equal(
-            conf_data.nnp_input.atomic_numbers, atomic_numbers_true[conf_idx]
-        )
-        assert np.array_equal(
-            conf_data.metadata.per_system_energy, energy_true[conf_idx]
-        )
+    # per-conformer ground truth, gathered with vectorized splits: series
+    # arrays (geometry) hold n_confs[rec] consecutive copies of the atoms of a
+    # record, single arrays (atomic_numbers) hold them once per record
+    atoms_per_conf = np.repeat(atomic_subsystem_counts, n_confs)
+    geom_true = np.split(input_data["geometry"], np.cumsum(atoms_per_conf)[:-1])
+    atomic_numbers_per_rec = np.split(
+        input_data["atomic_numbers"].ravel(),
+        np.cumsum(atomic_subsystem_counts)[:-1],
+    )
+    rec_of_conf = np.repeat(np.arange(total_records), n_confs)
+    atomic_numbers_true = [atomic_numbers_per_rec[rec] for rec in rec_of_conf]
+    energy_true = input_data["internal_energy_at_0K"]
+    series_mol_idxs = np.split(np.arange(total_confs), np.cumsum(n_confs)[:-1])
+
+    # fetch every conformer once and compare the stacked results in one go
+    conf_data = [dataset[conf_idx] for conf_idx in range(len(dataset))]
+    assert np.array_equal(
+        np.concatenate([c.nnp_input.positions for c in conf_data]),
+        np.concatenate(geom_true),
+    )
+    assert np.array_equal(
+        np.concatenate([c.nnp_input.atomic_numbers for c in conf_data]),
+        np.concatenate(atomic_numbers_true),
+    )
+    assert np.array_equal(
+        np.stack([c.metadata.per_system_energy for c in conf_data]), energy_true
+    )
 
     for rec_idx in range(dataset.record_len()):
         assert np.array_equal(
@@ -100,6 +119,32 @@ def test_dataset_basic_operations():
         )
 
 
+def test_dataset_from_npz_renamed_properties(prep_temp_dir):
+    # only the arrays named in PropertyNames are read from an NpzFile, so
+    # atomic numbers stored under another key must still be found
+    atomic_subsystem_counts = np.array([3, 4])
+    n_confs = np.array([2, 1])
+    npz_file = str(prep_temp_dir) + "/renamed_properties.npz"
+    np.savez(
+        npz_file,
+        geometry=np.zeros(((atomic_subsystem_counts * n_confs).sum(), 3)),
+        elements=np.arange(atomic_subsystem_counts.sum()).reshape(-1, 1),
+        internal_energy_at_0K=np.zeros((n_confs.sum(), 1)),
+        atomic_subsystem_counts=atomic_subsystem_counts,
+        n_confs=n_confs,
+    )
+
+    property_names = PropertyNames(
+        atomic_numbers="elements",
+        positions="geometry",
+        E="internal_energy_at_0K",
+    )
+    with np.load(npz_file) as npz_data:
+        dataset = TorchDataset(npz_data, property_names)
+    assert dataset.number_of_atoms == atomic_subsystem_counts.sum()
+    assert len(dataset) == n_confs.sum()
+
+
 @pytest.mark.parametrize("dataset_name", _ImplementedDatasets.get_all_dataset_names())
 def test_get_properties(dataset_name, single_batch_with_batchsize, prep_temp_dir):
 
@@ -113,7 +158,7 @@ def test_get_properties(dataset_name, single_batch_with_batchsize, prep_temp_dir
 
 
 @pytest.mark.parametrize("dataset_name", _ImplementedDatasets.get_all_dataset_names())
-def test_different_properties_of_interest(dataset_name, dataset_factory, prep_temp_dir):
+def test_different_properties_of_interest(dataset_name, built_dataset, prep_temp_dir):
     local_cache_dir = str(prep_temp_dir) + "/data_test"
 
     data = _ImplementedDatasets.get_dataset_class(
@@ -229,9 +274,7 @@ def test_different_properties_of_interest(dataset_name, dataset_factory, prep_te
             "atomic_numbers",
         ]
 
-    dataset = dataset_factory(
-        dataset_name=dataset_name, local_cache_dir=local_cache_dir
-    )
+    dataset = built_dataset(dataset_name)
 
     raw_data_item = dataset[0]
     assert isinstance(raw_data_item, BatchData)
@@ -505,9 +548,6 @@ def test_data_item_format_of_datamodule(
     )
 
 
-from modelforge.potential import _Implemented_NNPs
-
-
 @pytest.mark.parametrize("dataset_name", _ImplementedDatasets.get_all_dataset_names())
 def test_removal_of_self_energy(dataset_name, datamodule_factory, prep_temp_dir):
     # test the self energy calculation on the QM9 dataset
@@ -541,12 +581,25 @@ def test_removal_of_self_energy(dataset_name, datamodule_factory, prep_temp_dir)
     assert not torch.allclose(first_entry_with_ase, first_entry_without_ase)
 
 
-@pytest.mark.parametrize(
-    "potential_name", _Implemented_NNPs.get_all_neural_network_names()
+# expected pairs (with redundant atom pairs, as used by message passing
+# networks) of the first two QM9 molecules: methane and ammonium
+_METHANE_BONDS = torch.tensor(
+    [
+        [0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4],
+        [1, 2, 3, 4, 0, 2, 3, 4, 0, 1, 3, 4, 0, 1, 2, 4, 0, 1, 2, 3],
+    ],
+    dtype=torch.int64,
 )
-def test_dataset_neighborlist(
-    potential_name, single_batch_with_batchsize, prep_temp_dir
-):
+_AMMONIUM_BONDS = torch.tensor(
+    [
+        [5, 5, 5, 6, 6, 6, 7, 7, 7, 8],
+        [6, 7, 8, 5, 7, 8, 5, 6, 8, 5],
+    ],
+    dtype=torch.int64,
+)
+
+
+def test_dataset_neighborlist(single_batch_with_batchsize, prep_temp_dir):
     """Test the neighborlist."""
 
     batch = single_batch_with_batchsize(
@@ -554,7 +607,8 @@ def test_dataset_neighborlist(
     )
     nnp_input = batch.nnp_input
 
-    # test that the neighborlist is correctly generated
+    # test that the neighborlist is correctly generated; the pair list is a
+    # property of the input batch, so a single potential is enough to build it
     from modelforge.tests.helper_functions import setup_potential_for_test
 
     model = setup_potential_for_test(
@@ -575,80 +629,10 @@ def test_dataset_neighborlist(
     # first molecule is methane, check if bonds are correct
     methane_bonds = pair_list[:, :20]
 
-    assert (
-        torch.any(
-            torch.eq(
-                methane_bonds,
-                torch.tensor(
-                    [
-                        [
-                            0,
-                            0,
-                            0,
-                            0,
-                            1,
-                            1,
-                            1,
-                            1,
-                            2,
-                            2,
-                            2,
-                            2,
-                            3,
-                            3,
-                            3,
-                            3,
-                            4,
-                            4,
-                            4,
-                            4,
-                        ],
-                        [
-                            1,
-                            2,
-                            3,
-                            4,
-                            0,
-                            2,
-                            3,
-                            4,
-                            0,
-                            1,
-                            3,
-                            4,
-                            0,
-                            1,
-                            2,
-                            4,
-                            0,
-                            1,
-                            2,
-                            3,
-                        ],
-                    ]
-                ),
-            )
-            == False
-        ).item()
-        == False
-    )
+    assert torch.equal(methane_bonds, _METHANE_BONDS)
     # second molecule is ammonium, check if bonds are correct
     ammonium_bonds = pair_list[:, 20:30]
-    assert (
-        torch.any(
-            torch.eq(
-                ammonium_bonds,
-                torch.tensor(
-                    [
-                        [5, 5, 5, 6, 6, 6, 7, 7, 7, 8],
-                        [6, 7, 8, 5, 7, 8, 5, 6, 8, 5],
-                    ]
-                ),
-            )
-            == False
-        ).item()
-        == False
-    )
+    assert torch.equal(ammonium_bonds, _AMMONIUM_BONDS)
 
 
 @pytest.mark.parametrize("dataset_name", _ImplementedDatasets.get_all_dataset_names())
@@ -674,19 +658,19 @@ def test_dataset_generation(dataset_name, datamodule_factory, prep_temp_dir):
     # batches all with 64 points until the last which has 32
 
     assert len(train_dataloader) == 13  # nr of batches
-    batch_data = [v_ for v_ in train_dataloader]
-    val_data = [v_ for v_ in val_dataloader]
-    sum_batch = sum([len(b.metadata.atomic_subsystem_counts) for b in batch_data])
-    sum_val = sum([len(b.metadata.atomic_subsystem_counts) for b in val_data])
-    sum_test = sum([len(b.metadata.atomic_subsystem_counts) for b in test_dataloader])
+    # only the batch sizes are needed, so consume the dataloaders one batch at
+    # a time rather than keeping every batch alive in a list
+    batch_sizes = [len(b.metadata.atomic_subsystem_counts) for b in train_dataloader]
+    sum_val = sum(len(b.metadata.atomic_subsystem_counts) for b in val_dataloader)
+    sum_test = sum(len(b.metadata.atomic_subsystem_counts) for b in test_dataloader)
 
-    assert sum_batch == 800
+    assert sum(batch_sizes) == 800
     assert sum_val == 100
     assert sum_test == 100
 
-    assert len(batch_data[0].metadata.atomic_subsystem_counts) == 64
-    assert len(batch_data[1].metadata.atomic_subsystem_counts) == 64
-    assert len(batch_data[-1].metadata.atomic_subsystem_counts) == 32
+    assert batch_sizes[0] == 64
+    assert batch_sizes[1] == 64
+    assert batch_sizes[-1] == 32
 
 
 from modelforge.dataset.utils import (
@@ -802,16 +786,13 @@ def test_properties_assignment(
 
 
 @pytest.mark.parametrize("dataset_name", ["QM9"])
-def test_dataset_downloader(dataset_name, dataset_factory, prep_temp_dir):
+def test_dataset_downloader(dataset_name, built_dataset, built_dataset_dir):
     """
     Test the DatasetDownloader functionality.
     """
-    local_cache_dir = str(prep_temp_dir)
+    local_cache_dir = built_dataset_dir
 
-    dataset = dataset_factory(
-        dataset_name=dataset_name,
-        local_cache_dir=local_cache_dir,
-    )
+    dataset = built_dataset(dataset_name)
     data = _ImplementedDatasets.get_dataset_class(dataset_name)(
         local_cache_dir=local_cache_dir, version_select="nc_1000_v0"
     )
@@ -858,7 +839,7 @@ def test_energy_postprocessing(prep_temp_dir):
     dm.setup()
 
     batch = next(iter(dm.val_dataloader()))
-    unnormalized_E = batch.metadata.per_system_energy.numpy().flatten()
+    unnormalized_E = batch.metadata.per_system_energy.numpy().ravel()
     import numpy as np
 
     # check that normalized energies are correct
@@ -907,7 +888,7 @@ def test_energy_postprocessing(prep_temp_dir):
 
     # check that the normalization is correct
     normalized_atomic_energies = (
-        unnormalized_E / batch.metadata.atomic_subsystem_counts.numpy().flatten()
+        unnormalized_E / batch.metadata.atomic_subsystem_counts.numpy().ravel()
     )
     mean = np.average(normalized_atomic_energies)
     stddev = np.std(normalized_atomic_energies)
@@ -1011,23 +992,6 @@ def test_function_of_self_energy(dataset_name, datamodule_factory, prep_temp_dir
         -197492.33270235246,
     )
 
-    dm = datamodule_factory(
-        dataset_name=dataset_name,
-        batch_size=512,
-        splitting_strategy=FirstComeFirstServeSplittingStrategy(),
-        regression_ase=True,
-        remove_self_energies=True,
-        version_select="nc_1000_v0",
-        regenerate_dataset_statistic=True,
-        local_cache_dir=str(prep_temp_dir),
-    )
-    # it is saved in the dataset statistics
-    import toml
-
-    f = dm.dataset_statistic_filename
-    dataset_statistic = toml.load(f)
-    self_energies = dataset_statistic["atomic_self_energies"]
-
     # Test that self energies are correctly removed
     for regression in [True, False]:
         dm = datamodule_factory(
@@ -1060,11 +1024,17 @@ def test_function_of_self_energy(dataset_name, datamodule_factory, prep_temp_dir
 
         self_energies = AtomicSelfEnergies(self_energies)
 
-        methane_ase = sum(
-            [
-                self_energies[int(index)]
-                for index in list(methane_atomic_indices.numpy())
-            ]
+        # self energies indexed by atomic number; float64 lookup table, since
+        # ase_tensor_for_indexing is single precision
+        energy_by_atomic_number = self_energies.atomic_number_to_energy
+        self_energy_lut = torch.zeros(
+            max(energy_by_atomic_number) + 1, dtype=torch.float64
+        )
+        self_energy_lut[list(energy_by_atomic_number)] = torch.tensor(
+            list(energy_by_atomic_number.values()), dtype=torch.float64
+        )
+        methane_ase = (
+            self_energy_lut.index_select(0, methane_atomic_indices.long()).sum().item()
         )
         # compare this to the energy without postprocessing
         assert np.isclose(methane_energy_reference, methane_energy_offset + methane_ase)
@@ -1134,6 +1104,11 @@ def test_shifting_center_of_mass_to_origin(prep_temp_dir):
         shift_center_of_mass_to_origin=False,
         local_cache_dir=local_cache_dir,
     )
+    from modelforge.potential.neighbors import NeighborListForTraining
+
+    # the neighborlist does not depend on the conformer, build it once
+    nlist = NeighborListForTraining(cutoff=0.5)
+
     for conf_id in range(0, len(dm.torch_dataset)):
         start_idx_mol = dm.torch_dataset.series_atom_start_idxs_by_conf[conf_id]
         end_idx_mol = dm.torch_dataset.series_atom_start_idxs_by_conf[conf_id + 1]
@@ -1197,13 +1172,9 @@ def test_shifting_center_of_mass_to_origin(prep_temp_dir):
         assert torch.allclose(pos, pos_original - com_ns, atol=1e-3)
         assert torch.allclose(pos, pos_ns, atol=1e-3)
 
-        from modelforge.potential.neighbors import NeighborListForTraining
-
         nnp_input = dm.torch_dataset[conf_id].nnp_input
         nnp_input_ns = dm_no_shift.torch_dataset[conf_id].nnp_input
 
-        nlist = NeighborListForTraining(cutoff=0.5)
-
         pairs = nlist(nnp_input)
         pairs_ns = nlist(nnp_input_ns)
 
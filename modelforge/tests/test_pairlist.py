@@ -20,36 +20,34 @@ def test_pairlist_logic():
         [0, 0, 0, 1, 1, 2, 2, 2, 3, 3]
     )  # molecule index for each atom
 
-    # generate index grid
-    n = len(molecule_indices)
-    i_indices, j_indices = torch.triu_indices(n, n, 1)
-
-    # filter pairs to only keep those belonging to the same molecule
-    same_molecule_mask = molecule_indices[i_indices] == molecule_indices[j_indices]
-
-    # Apply mask to get final pair indices
-    i_final_pairs = i_indices[same_molecule_mask]
-    j_final_pairs = j_indices[same_molecule_mask]
+    # atoms of a molecule are contiguous, so enumerate the pairs of each
+    # molecule segment rather than filtering the full n x n index grid
+    counts = torch.bincount(molecule_indices)
+    offsets = torch.cat([torch.zeros(1, dtype=torch.long), counts.cumsum(0)[:-1]])
+    i_parts, j_parts = [], []
+    for count, offset in zip(counts.tolist(), offsets.tolist()):
+        i_segment, j_segment = torch.triu_indices(count, count, 1)
+        i_parts.append(i_segment + offset)
+        j_parts.append(j_segment + offset)
+    i_final_pairs = torch.cat(i_parts)
+    j_final_pairs = torch.cat(j_parts)
 
     # Concatenate to form final (2, n_pairs) tensor
     final_pair_indices = torch.stack((i_final_pairs, j_final_pairs))
 
-    assert torch.allclose(
+    assert torch.equal(
         final_pair_indices,
-        torch.tensor([[0, 0, 1, 3, 5, 5, 6, 8], [1, 2, 2, 4, 6, 7, 7, 9]]),
+        torch.tensor(
+            [[0, 0, 1, 3, 5, 5, 6, 8], [1, 2, 2, 4, 6, 7, 7, 9]],
+            dtype=final_pair_indices.dtype,
+        ),
     )
 
-    # Create pair_coordinates tensor
-    pair_coordinates = positions[final_pair_indices.T]
-    pair_coordinates = pair_coordinates.view(-1, 2, 3)
-
     # Calculate distances
-    distances = (pair_coordinates[:, 0, :] - pair_coordinates[:, 1, :]).norm(
-        p=2, dim=-1
-    )
-    # Calculate distances
-    distances = (pair_coordinates[:, 0, :] - pair_coordinates[:, 1, :]).norm(
-        p=2, dim=-1
+    distances = torch.linalg.vector_norm(
+        positions.index_select(0, i_final_pairs)
+        - positions.index_select(0, j_final_pairs),
+        dim=-1,
     )
 
     # Define a cutoff
@@ -60,9 +58,12 @@ def test_pairlist_logic():
 
     # Get the atom indices within the cutoff
     atom_pairs_withing_cutoff = final_pair_indices[:, in_cutoff]
-    assert torch.allclose(
+    assert torch.equal(
         atom_pairs_withing_cutoff,
-        torch.tensor([[0, 0, 1, 3, 5, 5, 8], [1, 2, 2, 4, 6, 7, 9]]),
+        torch.tensor(
+            [[0, 0, 1, 3, 5, 5, 8], [1, 2, 2, 4, 6, 7, 9]],
+            dtype=atom_pairs_withing_cutoff.dtype,
+        ),
     )
 
 
@@ -100,8 +101,11 @@ def test_pairlist():
     # pair2: pairlist[0][1] and pairlist[1][1], i.e. (0,2)
     # pair3: pairlist[0][2] and pairlist[1][2], i.e. (1,2)
 
-    assert torch.allclose(
-        pair_indices, torch.tensor([[0, 0, 1, 3, 3, 4], [1, 2, 2, 4, 5, 5]])
+    assert torch.equal(
+        pair_indices,
+        torch.tensor(
+            [[0, 0, 1, 3, 3, 4], [1, 2, 2, 4, 5, 5]], dtype=pair_indices.dtype
+        ),
     )
     # NOTE: pairs are defined on axis=1 and not axis=0
     assert torch.allclose(
@@ -263,16 +267,9 @@ def test_pairlist_on_dataset():
     )
 
     # test that the pairlist of 2 molecules is correct (which can then be expected also to be true for N molecules)
-    dataset = DataModule(
-        name="QM9",
-        batch_size=2,
-        version_select="nc_1000_v0",
-        splitting_strategy=FirstComeFirstServeSplittingStrategy(),
-        remove_self_energies=True,
-        regression_ase=False,
-    )
-    dataset.prepare_data()
-    dataset.setup()
+    # the batch size only enters when the dataloader is created, so the prepared
+    # datamodule is reused rather than running prepare_data/setup again
+    dataset.batch_size = 2
     # -------------------------------#
     # -------------------------------#
     # get methane input
@@ -686,7 +686,7 @@ def test_multiple_output_heads(
         config = _add_per_atom_charge_to_properties_to_process(config)
         config = _add_electrostatic_to_predicted_properties(config)
 
-    nr_of_mols = nnp_input.atomic_subsystem_indices.unique().shape[0]
+    nr_of_mols = nnp_input.atomic_subsystem_indices.unique_consecutive().shape[0]
     model = initialize_model(simulation_environment, config, jit)
 
     # Perform the forward pass through the model
@@ -728,7 +728,7 @@ def test_forward_pass(
     nnp_input = single_batch_with_batchsize(
         64, dataset_name, str(prep_temp_dir), version_select="nc_1000_v0"
     ).nnp_input
-    nr_of_mols = nnp_input.atomic_subsystem_indices.unique().shape[0]
+    nr_of_mols = nnp_input.atomic_subsystem_indices.unique_consecutive().shape[0]
 
     potential = setup_potential_for_test(
         potential_name,
@@ -801,9 +801,7 @@ def test_calculate_energies_and_forces(
     )
     # get energy and force
     E_training = trainer(nnp_input)["per_system_energy"]
-    F_training = -torch.autograd.grad(
-        E_training.sum(), nnp_input.positions, create_graph=True, retain_graph=True
-    )[0]
+    F_training = -torch.autograd.grad(E_training.sum(), nnp_input.positions)[0]
 
     # compare to inference model
     potential = setup_potential_for_test(
@@ -817,15 +815,13 @@ def test_calculate_energies_and_forces(
 
     # get energy and force
     E_inference = potential(nnp_input)["per_system_energy"]
-    F_inference = -torch.autograd.grad(
-        E_inference.sum(), nnp_input.positions, create_graph=True, retain_graph=True
-    )[0]
+    F_inference = -torch.autograd.grad(E_inference.sum(), nnp_input.positions)[0]
 
     print(f"Energy training: {E_training}")
     print(f"Energy inference: {E_inference}")
 
     # make sure that dimension are as expected
-    nr_of_mols = nnp_input.atomic_subsystem_indices.unique().shape[0]
+    nr_of_mols = nnp_input.atomic_subsystem_indices.unique_consecutive().shape[0]
     nr_of_atoms_per_batch = nnp_input.atomic_subsystem_indices.shape[0]
 
     assert E_inference.shape == (nr_of_mols, 1)  # per system
@@ -861,16 +857,12 @@ def test_calculate_energies_and_forces(
 
     # get energy and force
     E_inference = potential(nnp_input)["per_system_energy"]
-    F_inference = -torch.autograd.grad(
-        E_inference.sum(), nnp_input.positions, create_graph=True, retain_graph=True
-    )[0]
+    F_inference = -torch.autograd.grad(E_inference.sum(), nnp_input.positions)[0]
     # get energy and force
     E_training = potential(nnp_input)["per_system_energy"]
-    F_training = -torch.autograd.grad(
-        E_training.sum(), nnp_input.positions, create_graph=True, retain_graph=True
-    )[0]
+    F_training = -torch.autograd.grad(E_training.sum(), nnp_input.positions)[0]
 
-    nr_of_mols = nnp_input.atomic_subsystem_indices.unique().shape[0]
+    nr_of_mols = nnp_input.atomic_subsystem_indices.unique_consecutive().shape[0]
     nr_of_atoms_per_batch = nnp_input.atomic_subsystem_indices.shape[0]
 
     assert E_inference.shape == (nr_of_mols, 1)  # per system
@@ -1040,7 +1032,6 @@ def test_equivariant_energies_and_forces(
 
     # ------------------- #
     # start the test
-    # reference values
     nnp_input = single_batch_with_batchsize(
         batch_size=64,
         dataset_name="QM9",
@@ -1048,36 +1039,76 @@ def test_equivariant_energies_and_forces(
         version_select="nc_1000_v0",
     ).nnp_input.to_dtype(dtype=precision)
 
-    reference_result = potential(nnp_input)["per_system_energy"]
-    reference_forces = -torch.autograd.grad(
-        reference_result.sum(),
-        nnp_input.positions,
+    # evaluate the reference, translated, rotated and reflected copies of the
+    # batch in a single forward and backward pass: the copies are stacked as
+    # separate systems, with system and pair indices offset for each copy
+    from modelforge.utils.prop import NNPInput
+
+    positions = nnp_input.positions.detach()
+    variants = [
+        positions,
+        translation(positions),
+        rotation(positions),
+        reflection(positions),
+    ]
+    nr_of_copies = len(variants)
+    nr_of_atoms = positions.shape[0]
+    nr_of_systems = int(nnp_input.atomic_subsystem_indices.max()) + 1
+
+    pair_list = nnp_input.pair_list
+    if pair_list is not None and pair_list.numel() > 0:
+        pair_list = torch.cat(
+            [pair_list + copy * nr_of_atoms for copy in range(nr_of_copies)], dim=1
+        )
+    per_atom_partial_charge = nnp_input.per_atom_partial_charge
+    if per_atom_partial_charge.numel() > 0:
+        per_atom_partial_charge = per_atom_partial_charge.repeat(nr_of_copies)
+
+    stacked_input = NNPInput(
+        atomic_numbers=nnp_input.atomic_numbers.repeat(nr_of_copies),
+        positions=torch.cat(variants).requires_grad_(True),
+        atomic_subsystem_indices=torch.cat(
+            [
+                nnp_input.atomic_subsystem_indices + copy * nr_of_systems
+                for copy in range(nr_of_copies)
+            ]
+        ),
+        per_system_total_charge=nnp_input.per_system_total_charge.repeat(
+            nr_of_copies, *([1] * (nnp_input.per_system_total_charge.dim() - 1))
+        ),
+        box_vectors=nnp_input.box_vectors,
+        is_periodic=nnp_input.is_periodic,
+        pair_list=pair_list,
+        per_atom_partial_charge=per_atom_partial_charge,
+    )
+
+    stacked_result = potential(stacked_input)["per_system_energy"]
+    stacked_forces = -torch.autograd.grad(
+        stacked_result.sum(),
+        stacked_input.positions,
     )[0]
 
+    (
+        reference_result,
+        translation_result,
+        rotation_result,
+        reflection_result,
+    ) = stacked_result.split(nr_of_systems)
+    (
+        reference_forces,
+        translation_forces,
+        rotation_forces,
+        reflection_forces,
+    ) = stacked_forces.split(nr_of_atoms)
+
     # --------------------------------------- #
     # translation test
-    # set up input
-    nnp_input = single_batch_with_batchsize(
-        batch_size=64,
-        dataset_name="QM9",
-        local_cache_dir=str(prep_temp_dir),
-        version_select="nc_1000_v0",
-    ).nnp_input.to_dtype(dtype=precision)
-    translation_nnp_input = nnp_input.to_dtype(dtype=precision)
-    translation_nnp_input.positions = translation(translation_nnp_input.positions)
-
-    translation_result = potential(translation_nnp_input)["per_system_energy"]
     assert torch.allclose(
         translation_result,
         reference_result,
         atol=atol,
     )
 
-    translation_forces = -torch.autograd.grad(
-        translation_result.sum(),
-        translation_nnp_input.positions,
-    )[0]
-
     for t, r in zip(translation_forces, reference_forces):
         if not torch.allclose(t, r, atol=atol):
             print(t, r)
@@ -1090,17 +1121,6 @@ def test_equivariant_energies_and_forces(
 
     # --------------------------------------- #
     # rotation test
-    # set up input
-    nnp_input = single_batch_with_batchsize(
-        batch_size=64,
-        dataset_name="QM9",
-        local_cache_dir=str(prep_temp_dir),
-        version_select="nc_1000_v0",
-    ).nnp_input.to_dtype(dtype=precision)
-    rotation_input_data = nnp_input.to_dtype(dtype=precision)
-    rotation_input_data.positions = rotation(rotation_input_data.positions)
-    rotation_result = potential(rotation_input_data)["per_system_energy"]
-
     for t, r in zip(rotation_result, reference_result):
         if not torch.allclose(t, r, atol=atol):
             print(t, r)
@@ -1111,13 +1131,6 @@ def test_equivariant_energies_and_forces(
         atol=atol,
     )
 
-    rotation_forces = -torch.autograd.grad(
-        rotation_result.sum(),
-        rotation_input_data.positions,
-        create_graph=True,
-        retain_graph=True,
-    )[0]
-
     rotate_reference = rotation(reference_forces)
     print(rotation_forces, rotate_reference)
     assert torch.allclose(
@@ -1128,22 +1141,6 @@ def test_equivariant_energies_and_forces(
 
     # --------------------------------------- #
     # reflection test
-    # set up input
-    nnp_input = single_batch_with_batchsize(
-        batch_size=64,
-        dataset_name="QM9",
-        local_cache_dir=str(prep_temp_dir),
-        version_select="nc_1000_v0",
-    ).nnp_input.to_dtype(dtype=precision)
-    reflection_input_data = nnp_input.to_dtype(dtype=precision)
-    reflection_input_data.positions = reflection(reflection_input_data.positions)
-    reflection_result = potential(reflection_input_data)["per_system_energy"]
-    reflection_forces = -torch.autograd.grad(
-        reflection_result.sum(),
-        reflection_input_data.positions,
-        create_graph=True,
-        retain_graph=True,
-    )[0]
     for t, r in zip(reflection_result, reference_result):
         if not torch.allclose(t, r, atol=atol):
             print(t, r)
@@ -117,6 +117,28 @@ def test_md5_calculation(prep_temp_dir):
         )
 
 
+def test_md5_calculation_rewrite(prep_temp_dir):
+    # a file rewritten in place with the same size, as when a fixed-length
+    # file is downloaded again, has to be hashed again
+    import hashlib
+
+    file_path = str(prep_temp_dir)
+    file_name = "md5_rewrite_test.txt"
+
+    with open(f"{file_path}/{file_name}", "w") as f:
+        f.write("first version")
+    mtime_ns = os.stat(f"{file_path}/{file_name}").st_mtime_ns
+    first = calculate_md5_checksum(file_name=file_name, file_path=file_path)
+    assert first == hashlib.md5(b"first version").hexdigest()
+
+    with open(f"{file_path}/{file_name}", "w") as f:
+        f.write("other version")
+    # emulate a filesystem with coarse modification times
+    os.utime(f"{file_path}/{file_name}", ns=(mtime_ns, mtime_ns))
+    second = calculate_md5_checksum(file_name=file_name, file_path=file_path)
+    assert second == hashlib.md5(b"other version").hexdigest()
+
+
 @pytest.mark.skipif(
     IN_GITHUB_ACTIONS,
     reason="Skipping; requires authentication which cannot be done via PR from fork ",
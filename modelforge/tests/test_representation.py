@@ -1,22 +1,22 @@
 import torch
 import pytest
 
+# 5 angstrom expressed in nanometer, avoids pint conversions inside the tests
+_CUTOFF_5_ANGSTROM_IN_NM = 0.5
+
 
 def test_radial_symmetry_function_implementation():
     """
     Test the Radial Symmetry function implementation.
     """
     import torch
-    from openff.units import unit
     import numpy as np
     from modelforge.potential.representation import (
         CosineAttenuationFunction,
         GaussianRadialBasisFunctionWithScaling,
     )
 
-    cutoff_module = CosineAttenuationFunction(
-        cutoff=unit.Quantity(5.0, unit.angstrom).to(unit.nanometer).m
-    )
+    cutoff_module = CosineAttenuationFunction(cutoff=_CUTOFF_5_ANGSTROM_IN_NM)
 
     class RadialSymmetryFunctionTest(GaussianRadialBasisFunctionWithScaling):
         @staticmethod
@@ -51,7 +51,7 @@ def test_radial_symmetry_function_implementation():
 
     RSF = RadialSymmetryFunctionTest(
         number_of_radial_basis_functions=18,
-        max_distance=unit.Quantity(5.0, unit.angstrom).to(unit.nanometer).m,
+        max_distance=_CUTOFF_5_ANGSTROM_IN_NM,
     )
     # test a single distance
     d_ij = torch.tensor([[0.2]])
@@ -395,6 +395,40 @@ def test_ani_rbf():
     ), "Outputs do not match expected values for AniRadialBasisFunction"
 
 
+def test_ani_rbf_with_cosine_cutoff():
+    """
+    Test that the fused radial basis and cutoff of the AniRadialBasisFunction
+    matches the separate evaluation of both modules.
+    """
+    from modelforge.potential.representation import (
+        AniRadialBasisFunction,
+        CosineAttenuationFunction,
+    )
+
+    # both paths evaluate the same expression, compare them in double
+    # precision with a tight tolerance
+    dtype = torch.float64
+    distances = torch.tensor([[0.1], [0.25], [0.45], [0.6]], dtype=dtype)
+    max_distance = 0.5
+
+    rbf = AniRadialBasisFunction(
+        number_of_radial_basis_functions=16,
+        max_distance=max_distance,
+        min_distance=0.08,
+        dtype=dtype,
+    )
+    cutoff_module = CosineAttenuationFunction(max_distance)
+
+    expected_output = rbf(distances) * cutoff_module(distances)
+    actual_output = rbf.forward_with_cosine_cutoff(distances, cutoff_module.cutoff)
+
+    assert actual_output.dtype == dtype
+    assert actual_output.shape == expected_output.shape, "Output shape mismatch"
+    assert torch.allclose(actual_output, expected_output, rtol=1e-10, atol=1e-14)
+    # contributions beyond the cutoff vanish
+    assert torch.all(actual_output[-1] == 0.0)
+
+
 def test_physnet_rbf():
     """
     Test the PhysNetRadialBasisFunction class.
@@ -90,6 +90,18 @@ def test_interaction_forward():
     pairlist = pairlist[edge_mask].T
     sake_block(h, x, v, pairlist)
 
+    # with a pair list sorted by receiver, passing the segment lengths gives
+    # the same result as the scatter path
+    from modelforge.potential.utils import segment_lengths_if_sorted
+
+    pairlist = pairlist[:, torch.argsort(pairlist[0], stable=True)]
+    counts = segment_lengths_if_sorted(pairlist[0], nr_atoms)
+    assert counts is not None
+    for reference, result in zip(
+        sake_block(h, x, v, pairlist), sake_block(h, x, v, pairlist, counts)
+    ):
+        assert torch.allclose(reference, result, atol=1e-5)
+
 
 @pytest.mark.parametrize("eq_atol", [3e-1])
 @pytest.mark.parametrize("h_atol", [8e-2])
@@ -301,6 +301,23 @@ def test_scatter_softmax():
     assert torch.allclose(util_out, correct_out)
 
 
+def test_scatter_softmax_sorted_index():
+    from modelforge.potential.utils import scatter_softmax, segment_lengths_if_sorted
+
+    # the segment reduction path must agree with the scatter path
+    index = torch.tensor([0, 0, 1, 1, 1, 3])
+    src = torch.randn(6, 4)
+    expanded_index = index.view(-1, 1).expand_as(src)
+
+    counts = segment_lengths_if_sorted(index, 4)
+    assert torch.equal(counts, torch.tensor([2, 3, 0, 1]))
+    assert segment_lengths_if_sorted(index.flip(0), 4) is None
+
+    reference = scatter_softmax(src, expanded_index, dim=0, dim_size=4)
+    segment_out = scatter_softmax(src, expanded_index, dim=0, dim_size=4, counts=counts)
+    assert torch.allclose(segment_out, reference)
+
+
 def test_energy_readout():
     from modelforge.potential.processing import FromAtomToMoleculeReduction
     import torch
@@ -350,3 +367,25 @@ def test_welford():
         assert np.isclose(online_estimator.mean / target_mean, 1.0, rtol=1e-1)
         assert np.isclose(online_estimator.variance / target_variance, 1.0, rtol=1e-1)
         assert np.isclose(online_estimator.stddev / target_stddev, 1.0, rtol=1e-1)
+
+
+def test_convert_str_or_unit_to_unit_length():
+    """
+    Test the length conversion for strings (cached) and quantities.
+    """
+    from openff.units import unit
+    from modelforge.utils.units import (
+        _convert_str_or_unit_to_unit_length,
+        _convert_str_to_nanometer,
+    )
+
+    assert _convert_str_or_unit_to_unit_length("1.0 * nanometer") == 1.0
+    assert _convert_str_or_unit_to_unit_length(
+        unit.Quantity(5.0, unit.angstrom)
+    ) == pytest.approx(0.5)
+
+    # repeated strings are served from the cache
+    hits = _convert_str_to_nanometer.cache_info().hits
+    assert _convert_str_or_unit_to_unit_length("5.1 angstrom") == pytest.approx(0.51)
+    assert _convert_str_or_unit_to_unit_length("5.1 angstrom") == pytest.approx(0.51)
+    assert _convert_str_to_nanometer.cache_info().hits > hits
@@ -122,6 +122,31 @@ def str_to_float(x: str) -> float:
     return xf
 
 
+def str_to_float_array(x):
+    """
+    Converts an array of strings to floats, changing Mathematica style scientific notation to python style.
+
+    This is the vectorized counterpart of str_to_float.
+
+    Parameters
+    ----------
+    x : array_like of str, required
+        Strings to process.
+
+    Returns
+    -------
+    np.ndarray
+        Array of float64 values with the same shape as the input.
+
+    Examples
+    --------
+    >>> output_array = str_to_float_array(['1*^6', '10123.0'])
+    """
+    import numpy as np
+
+    return np.char.replace(np.asarray(x, dtype=str), "*^", "e").astype(np.float64)
+
+
 def extract_tarred_file(
     input_path_dir: str,
     file_name: str,
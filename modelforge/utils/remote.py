@@ -96,7 +96,7 @@ def calculate_md5_checksum(file_name: str, file_path: str) -> str:
     with OpenWithLock(f"{file_path}/{file_name}.lockfile", "w") as fl:
         with open(f"{file_path}/{file_name}", "rb") as f:
             file_hash = hashlib.md5()
-            while chunk := f.read(8192):
+            while chunk := f.read(1024 * 1024):
                 file_hash.update(chunk)
 
     os.remove(f"{file_path}/{file_name}.lockfile")
@@ -6,6 +6,7 @@ energy units and includes utility functions for handling units within
 the model forge framework.
 """
 
+from functools import lru_cache
 from typing import Union
 
 from openff.units import unit
@@ -79,10 +80,22 @@ def _convert_str_or_unit_to_unit_length(val: Union[unit.Quantity, str]) -> float
     0.1
     """
     if isinstance(val, str):
-        val = unit.Quantity(val)
+        return _convert_str_to_nanometer(val)
     return val.to(unit.nanometer).m
 
 
+@lru_cache(maxsize=None)
+def _convert_str_to_nanometer(val: str) -> float:
+    """
+    Parse a length string and return its magnitude in nanometers.
+
+    Parsing with pint is slow compared to the rest of a potential setup, and
+    the same few cutoff strings are parsed every time a potential is built
+    from a configuration, so the result is cached per string.
+    """
+    return unit.Quantity(val).to(unit.nanometer).m
+
+
 def _convert_str_to_unit(val: Union[unit.Quantity, str]) -> unit.Quantity:
     """
     Convert a string representation of a unit to an OpenFF unit.Quantity.